@@ -6,7 +6,7 @@ This demonstrates how to use the most common operations.
 
 import asyncio
 import json
-from railgun_mcp import Config
+from railgun_mcp import get_config
 
 
 async def basic_operations():
@@ -14,7 +14,7 @@ async def basic_operations():
 
     # Note: This example shows the concepts but would need actual API integration
     # The real server handles API client management internally
-    config = Config()
+    config = get_config()
 
     print("📋 Basic Operations Example")
     print("=" * 40)
@@ -71,14 +71,20 @@ async def privacy_workflow():
     print("   3. Use these tools through your AI assistant")
 
 
-if __name__ == "__main__":
-    print("Railgun MCP Basic Usage Examples")
-    print("=" * 50)
+async def main():
+    """Run all examples on a single event loop."""
 
     # Run basic operations
-    asyncio.run(basic_operations())
+    await basic_operations()
 
     print("\n" + "=" * 50)
 
     # Run privacy workflow
-    asyncio.run(privacy_workflow())
+    await privacy_workflow()
+
+
+if __name__ == "__main__":
+    print("Railgun MCP Basic Usage Examples")
+    print("=" * 50)
+
+    asyncio.run(main())
@@ -9,26 +9,24 @@ __version__ = "0.2.1"
 __author__ = "Sam Savage"
 __license__ = "MIT"
 
-from .models import Config, Token, TokenAmount, Step, Recipe
+from .models import Config, get_config, Token, TokenAmount, Step, Recipe
 
-# Conditionally import server module (requires fastmcp)
-try:
-    from .server import main
+__all__ = [
+    "main",
+    "Config",
+    "get_config",
+    "Token",
+    "TokenAmount",
+    "Step",
+    "Recipe",
+]
 
-    __all__ = [
-        "main",
-        "Config",
-        "Token",
-        "TokenAmount",
-        "Step",
-        "Recipe",
-    ]
-except ImportError:
-    # fastmcp not available, only expose models
-    __all__ = [
-        "Config",
-        "Token",
-        "TokenAmount",
-        "Step",
-        "Recipe",
-    ]
+
+def __getattr__(name):
+    # Import the server (and fastmcp) only when `main` is actually requested,
+    # so using the models and Config stays cheap
+    if name == "main":
+        from .server import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,16 +4,78 @@ Models and data structures for Railgun MCP Server
 """
 
 import json
+import mmap
 import os
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
-from enum import Enum
+import re
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass, field, fields, is_dataclass
+from enum import Enum, IntEnum
 from pathlib import Path
+from types import MappingProxyType
 import logging
 
+if TYPE_CHECKING:
+    import aiohttp
+
 logger = logging.getLogger(__name__)
 
 
+def _json_default(obj: Any) -> Any:
+    if is_dataclass(obj):
+        # Match orjson, which skips underscore-prefixed fields
+        return {
+            f.name: getattr(obj, f.name)
+            for f in fields(obj)
+            if not f.name.startswith("_")
+        }
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_json_dumps(obj: Any) -> str:
+    return json.dumps(obj, default=_json_default)
+
+
+# JSON codec: orjson when installed (``pip install railgun-mcp[speedups]``),
+# stdlib json otherwise. Both serialize the dataclasses and enums below.
+# orjson only handles 64-bit integers: encoding falls back to stdlib json for
+# larger ones (wei amounts), and json_loads_exact decodes payloads that may
+# carry them, since orjson.loads would turn them into floats.
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            return _stdlib_json_dumps(obj)
+
+    # Every integer beyond 64 bits has at least 20 digits. A run that long
+    # elsewhere (in a string or float) just costs the slower stdlib parse
+    _LONG_DIGITS = re.compile(rb"\d{20}")
+
+    def json_loads_exact(data: bytes) -> Any:
+        """Like json_loads, but keeps integers of any size exact"""
+        if _LONG_DIGITS.search(data):
+            return json.loads(data)
+        return orjson.loads(data)
+
+except ImportError:
+
+    def json_loads(data: Any) -> Any:
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
+
+    json_dumps = _stdlib_json_dumps
+    json_loads_exact = json_loads
+
+
 # Enums for Railgun types
 class TokenType(Enum):
     ERC20 = "ERC20"
@@ -21,6 +83,11 @@ class TokenType(Enum):
     NATIVE = "NATIVE"
 
 
+# Read-only value -> member tables; decoding with `.get()` on these skips
+# Enum.__call__ for values coming off the wire.
+_TOKENTYPE_BY_VALUE = MappingProxyType({sys.intern(m.value): m for m in TokenType})
+
+
 class StepType(Enum):
     APPROVE = "approve"
     SWAP = "swap"
@@ -33,6 +100,9 @@ class StepType(Enum):
     UNSTAKE = "unstake"
 
 
+_STEPTYPE_BY_VALUE = MappingProxyType({sys.intern(m.value): m for m in StepType})
+
+
 class Network(Enum):
     ETHEREUM = "ethereum"
     ARBITRUM = "arbitrum"
@@ -40,15 +110,43 @@ class Network(Enum):
     BSC = "bsc"
 
 
-class TransactionStatus(Enum):
-    PENDING = "pending"
-    CONFIRMED = "confirmed"
-    FAILED = "failed"
-    CANCELLED = "cancelled"
+_NETWORK_BY_VALUE = MappingProxyType({sys.intern(m.value): m for m in Network})
+
+SUPPORTED_NETWORKS: frozenset[str] = frozenset(_NETWORK_BY_VALUE)
+
+
+class TransactionStatus(IntEnum):
+    PENDING = 0
+    CONFIRMED = 1
+    FAILED = 2
+    CANCELLED = 3
+
+    @property
+    def label(self) -> str:
+        """Wire and display name of the status, such as pending"""
+        return _TRANSACTION_STATUS_LABELS[self]
+
+
+# Indexed by TransactionStatus value
+_TRANSACTION_STATUS_LABELS = ("pending", "confirmed", "failed", "cancelled")
+
+# Keyed by label: statuses arrive from the API as strings
+_TRANSACTIONSTATUS_BY_VALUE = MappingProxyType(
+    {sys.intern(m.label): m for m in TransactionStatus}
+)
+
+
+def normalize_address(address: str) -> str:
+    """Lowercase and intern a 0x address so later comparisons are plain =="""
+    return sys.intern(address.lower())
+
+
+def _normalize_contracts(contracts: dict[str, str]) -> dict[str, str]:
+    return {name: normalize_address(address) for name, address in contracts.items()}
 
 
 # Data classes
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Token:
     address: str
     symbol: str
@@ -56,118 +154,280 @@ class Token:
     type: TokenType
     chain_id: int
 
+    def __post_init__(self):
+        object.__setattr__(self, "address", normalize_address(self.address))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TokenAmount:
     token: Token
     amount: str  # Wei amount as string
+    # Parsed once; underscore-prefixed so it is left out of JSON output
+    _amount_wei: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_amount_wei", int(self.amount))
+
+    @property
+    def amount_wei(self) -> int:
+        """Amount as an int, for arithmetic and comparisons"""
+        return self._amount_wei
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Step:
     id: str
     type: StepType
     description: str
-    inputs: List[TokenAmount]
-    outputs: List[TokenAmount]
-    contract_address: Optional[str] = None
-    function_name: Optional[str] = None
-    function_args: Optional[Dict[str, Any]] = None
+    inputs: list[TokenAmount]
+    outputs: list[TokenAmount]
+    contract_address: str | None = None
+    function_name: str | None = None
+    function_args: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Recipe:
     id: str
     name: str
     description: str
-    steps: List[Step]
+    steps: list[Step]
     network: Network
     created_at: str
 
 
+DEFAULT_RAILGUN_API_URL = "https://api.railgun.org/v1"
+
+# RAILGUN smart contract addresses (mainnet)
+_DEFAULT_RAILGUN_CONTRACTS = MappingProxyType(
+    {
+        network: MappingProxyType(_normalize_contracts(contracts))
+        for network, contracts in {
+            "ethereum": {
+                "proxy": "0xFA7093CDD9EE6932B4eb2c9e1cde7CE00B1FA4b9",
+                "poseidon": "0x3e3a3D69dc66bA10737F531ed088954a9EC89d97",
+                "verifier": "0x87C7fd0635Fb4E2FE5A3b40d5a57E96cE01a0B7a",
+            },
+            "polygon": {
+                "proxy": "0x19b620929f97b7b990801496c3b361ca5def8c71",
+                "poseidon": "0x3e3a3D69dc66bA10737F531ed088954a9EC89d97",
+                "verifier": "0x87C7fd0635Fb4E2FE5A3b40d5a57E96cE01a0B7a",
+            },
+            "bsc": {
+                "proxy": "0x590162bf4b50f6576a459b75309ee21d92178a10",
+                "poseidon": "0x3e3a3D69dc66bA10737F531ed088954a9EC89d97",
+                "verifier": "0x87C7fd0635Fb4E2FE5A3b40d5a57E96cE01a0B7a",
+            },
+        }.items()
+    }
+)
+
+# Network chain IDs
+_DEFAULT_CHAIN_IDS = MappingProxyType(
+    {"ethereum": 1, "polygon": 137, "bsc": 56, "arbitrum": 42161}
+)
+
+
+@lru_cache(maxsize=4)
+def _load_config_file(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a config file, reusing the result until its mtime or size changes.
+
+    The returned dict is shared between Config instances and must not be
+    mutated.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return json_loads(view)
+
+
+# Seconds to reuse resolved host addresses across new connections
+DNS_CACHE_TTL = 300
+
+
+def make_connector(**kwargs: Any) -> "aiohttp.TCPConnector":
+    """Build a TCPConnector with a cached DNS lookup per host.
+
+    Resolves through aiodns, off the default thread pool, when it is installed
+    (``pip install railgun-mcp[speedups]``). It is passed explicitly because
+    older aiohttp releases default to the threaded resolver even then.
+    """
+    import aiohttp
+
+    if "resolver" not in kwargs:
+        try:
+            import aiodns  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            kwargs["resolver"] = aiohttp.AsyncResolver()
+
+    return aiohttp.TCPConnector(
+        use_dns_cache=True, ttl_dns_cache=DNS_CACHE_TTL, **kwargs
+    )
+
+
 # Configuration
 class Config:
     """Configuration management for Railgun MCP - Direct blockchain interaction"""
 
+    __slots__ = (
+        "private_key",
+        "wallet_password",
+        "api_key",
+        "railgun_api_url",
+        "rpc_endpoints",
+        "rpc_batch_size",
+        "rpc_pool_per_host",
+        "rpc_timeout",
+        "api_pool_per_host",
+        "api_timeout",
+        "railgun_contracts",
+        "chain_ids",
+        "get_rpc_url",
+        "get_railgun_proxy",
+        "_proxy_table",
+        "_sessions",
+    )
+
+    # Headers for every HTTP session talking to RPC/API endpoints; gzip cuts
+    # transfer time on large JSON-RPC responses (eth_getLogs, transfers)
+    rpc_default_headers = MappingProxyType(
+        {"Accept-Encoding": "gzip", "Content-Type": "application/json"}
+    )
+
     def __init__(self):
+        # One bound lookup for all environment reads below
+        getenv = os.environ.get
+
         # Private key for wallet operations (required)
-        self.private_key = os.getenv("RAILGUN_PRIVATE_KEY")
+        self.private_key = getenv("RAILGUN_PRIVATE_KEY")
 
         # Wallet password for local encryption (optional)
-        self.wallet_password = os.getenv("RAILGUN_WALLET_PASSWORD")
+        self.wallet_password = getenv("RAILGUN_WALLET_PASSWORD")
+
+        # Railgun API credentials and base URL (optional)
+        self.api_key = getenv("RAILGUN_API_KEY")
+        self.railgun_api_url = getenv("RAILGUN_API_URL")
 
         # RPC endpoints for direct blockchain connection
         self.rpc_endpoints = {
-            "ethereum": os.getenv(
+            "ethereum": getenv(
                 "ETHEREUM_RPC_URL", "https://eth-mainnet.g.alchemy.com/v2/your-api-key"
             ),
-            "arbitrum": os.getenv(
+            "arbitrum": getenv(
                 "ARBITRUM_RPC_URL", "https://arb-mainnet.g.alchemy.com/v2/your-api-key"
             ),
-            "polygon": os.getenv(
+            "polygon": getenv(
                 "POLYGON_RPC_URL",
                 "https://polygon-mainnet.g.alchemy.com/v2/your-api-key",
             ),
-            "bsc": os.getenv("BSC_RPC_URL", "https://bsc-dataseed.binance.org/"),
+            "bsc": getenv("BSC_RPC_URL", "https://bsc-dataseed.binance.org/"),
         }
 
-        # RAILGUN smart contract addresses (mainnet)
-        self.railgun_contracts = {
-            "ethereum": {
-                "proxy": "0xFA7093CDD9EE6932B4eb2c9e1cde7CE00B1FA4b9",
-                "poseidon": "0x3e3a3D69dc66bA10737F531ed088954a9EC89d97",
-                "verifier": "0x87C7fd0635Fb4E2FE5A3b40d5a57E96cE01a0B7a",
-            },
-            "polygon": {
-                "proxy": "0x19b620929f97b7b990801496c3b361ca5def8c71",
-                "poseidon": "0x3e3a3D69dc66bA10737F531ed088954a9EC89d97",
-                "verifier": "0x87C7fd0635Fb4E2FE5A3b40d5a57E96cE01a0B7a",
-            },
-            "bsc": {
-                "proxy": "0x590162bf4b50f6576a459b75309ee21d92178a10",
-                "poseidon": "0x3e3a3D69dc66bA10737F531ed088954a9EC89d97",
-                "verifier": "0x87C7fd0635Fb4E2FE5A3b40d5a57E96cE01a0B7a",
-            },
-        }
+        # Maximum JSON-RPC calls per batched request (providers cap batches
+        # around 50)
+        self.rpc_batch_size = int(getenv("RAILGUN_RPC_BATCH", "25"))
+
+        # Connection pool sizing and timeout for the per-network RPC sessions
+        self.rpc_pool_per_host = int(getenv("RAILGUN_POOL_PER_HOST", "20"))
+        self.rpc_timeout = float(getenv("RAILGUN_RPC_TIMEOUT", "30"))
+        self._sessions = {}
 
-        # Network chain IDs
-        self.chain_ids = {"ethereum": 1, "polygon": 137, "bsc": 56, "arbitrum": 42161}
+        # Connection pool sizing and timeout for the shared Railgun API session;
+        # fan-out tools keep up to this many requests in flight on one host
+        self.api_pool_per_host = int(getenv("RAILGUN_API_POOL_PER_HOST", "64"))
+        self.api_timeout = float(getenv("RAILGUN_API_TIMEOUT", "30"))
+
+        # RAILGUN smart contract addresses and chain IDs; shared read-only
+        # defaults, copied only when the config file overrides them
+        self.railgun_contracts = _DEFAULT_RAILGUN_CONTRACTS
+        self.chain_ids = _DEFAULT_CHAIN_IDS
 
         # Try to load from config file if env vars not set
         config_path = Path.home() / ".railgun" / "config.json"
-        if config_path.exists():
+        try:
+            stat = os.stat(config_path)
+        except OSError:
+            stat = None
+        if stat is not None:
             try:
-                with open(config_path, "r") as f:
-                    config_data = json.load(f)
-                    self.private_key = self.private_key or config_data.get(
-                        "private_key"
-                    )
-                    self.wallet_password = self.wallet_password or config_data.get(
-                        "wallet_password"
-                    )
-                    self.rpc_endpoints.update(config_data.get("rpc_endpoints", {}))
-
-                    # Allow override of contract addresses if needed
-                    if "railgun_contracts" in config_data:
-                        for network, contracts in config_data[
-                            "railgun_contracts"
-                        ].items():
-                            if network in self.railgun_contracts:
-                                self.railgun_contracts[network].update(contracts)
-                            else:
-                                self.railgun_contracts[network] = contracts
+                config_data = _load_config_file(
+                    str(config_path), stat.st_mtime_ns, stat.st_size
+                )
+                self.private_key = self.private_key or config_data.get("private_key")
+                self.wallet_password = self.wallet_password or config_data.get(
+                    "wallet_password"
+                )
+                self.api_key = self.api_key or config_data.get("api_key")
+                self.railgun_api_url = self.railgun_api_url or config_data.get(
+                    "railgun_api_url"
+                )
+                self.rpc_endpoints.update(config_data.get("rpc_endpoints", {}))
+
+                # Allow override of contract addresses if needed
+                if "railgun_contracts" in config_data:
+                    railgun_contracts = {
+                        network: dict(contracts)
+                        for network, contracts in self.railgun_contracts.items()
+                    }
+                    for network, contracts in config_data["railgun_contracts"].items():
+                        railgun_contracts.setdefault(network, {}).update(
+                            _normalize_contracts(contracts)
+                        )
+                    self.railgun_contracts = railgun_contracts
 
             except Exception as e:
                 logger.warning(f"Failed to load config file: {e}")
 
-    def get_rpc_url(self, network: str) -> str:
-        """Get RPC URL for a network"""
-        return self.rpc_endpoints.get(network)
+        self.railgun_api_url = self.railgun_api_url or DEFAULT_RAILGUN_API_URL
+
+        # Lookups used on every RPC dispatch, bound straight to dict.get:
+        # get_rpc_url(network) -> URL, get_railgun_proxy(network) -> address
+        self._proxy_table = {
+            network: contracts.get("proxy")
+            for network, contracts in self.railgun_contracts.items()
+        }
+        self.get_rpc_url = self.rpc_endpoints.get
+        self.get_railgun_proxy = self._proxy_table.get
 
     def get_chain_id(self, network: str) -> int:
         """Get chain ID for a network"""
         return self.chain_ids.get(network, 1)
 
-    def get_railgun_proxy(self, network: str) -> str:
-        """Get RAILGUN proxy contract address for a network"""
-        return self.railgun_contracts.get(network, {}).get("proxy")
+    def get_session(self, network: str) -> "aiohttp.ClientSession":
+        """Get the pooled RPC session for a network, creating it on first use.
+
+        Must be called from a running event loop; sessions keep connections
+        (and TLS) alive across calls until ``close_sessions()``.
+        """
+        session = self._sessions.get(network)
+        if session is None or session.closed:
+            if network not in SUPPORTED_NETWORKS:
+                raise ValueError(f"Unsupported network: {network}")
+
+            import aiohttp
+
+            session = aiohttp.ClientSession(
+                connector=make_connector(limit_per_host=self.rpc_pool_per_host),
+                headers=dict(self.rpc_default_headers),
+                timeout=aiohttp.ClientTimeout(total=self.rpc_timeout),
+            )
+            self._sessions[network] = session
+        return session
+
+    async def close_sessions(self) -> None:
+        """Close all pooled RPC sessions"""
+        sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            await session.close()
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the process-wide Config, loading it on first use.
+
+    ``Config()`` re-reads the environment and ``~/.railgun/config.json`` every
+    time it is constructed; long-lived callers such as the server should share
+    this instance instead. Call ``get_config.cache_clear()`` to force a reload.
+    """
+    return Config()
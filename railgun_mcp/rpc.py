@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+JSON-RPC helpers for talking to the chain endpoints in Config.rpc_endpoints
+"""
+
+import asyncio
+import time
+from collections.abc import Sequence
+from typing import Any
+
+import aiohttp
+
+from .models import Config, json_dumps, json_loads
+
+
+class RpcError(Exception):
+    """Error object returned by a JSON-RPC endpoint"""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(f"RPC error {code}: {message}")
+        self.code = code
+        self.message = message
+
+
+_MISSING = object()
+
+
+class TtlCache:
+    """Small in-process cache whose entries expire after a per-entry TTL"""
+
+    __slots__ = ("_entries",)
+
+    def __init__(self):
+        self._entries: dict[Any, tuple[int, Any]] = {}
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Get a cached value, or default if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expiry_ns, value = entry
+        if expiry_ns < time.monotonic_ns():
+            del self._entries[key]
+            return default
+        return value
+
+    def set(self, key: Any, value: Any, ttl_ns: int) -> None:
+        """Cache a value for ttl_ns nanoseconds"""
+        self._entries[key] = (time.monotonic_ns() + ttl_ns, value)
+
+    def pop(self, key: Any) -> None:
+        """Drop a cached value"""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached values"""
+        self._entries.clear()
+
+
+# Cache lifetimes per category of read-only RPC, in nanoseconds
+RPC_CACHE_TTL_NS = {
+    "chainId": 3600 * 10**9,
+    "getCode": 3600 * 10**9,
+    "tokenMetadata": 86400 * 10**9,
+    "balance": 30 * 10**9,
+    "blockNumber": 12 * 10**9,
+}
+
+# Read-only methods whose results may be served from the RPC cache
+_CACHED_METHODS = {
+    "eth_chainId": "chainId",
+    "net_version": "chainId",
+    "eth_getCode": "getCode",
+    "alchemy_getTokenMetadata": "tokenMetadata",
+    "eth_getBalance": "balance",
+    "eth_blockNumber": "blockNumber",
+}
+
+rpc_cache = TtlCache()
+
+
+class BatchedRpc:
+    """Coalesce JSON-RPC calls to one network into batched POSTs.
+
+    Calls queued with ``call()`` are sent when the block exits (or on an
+    explicit ``flush()``), at most ``config.rpc_batch_size`` per request, over
+    the network's pooled session unless one is passed in:
+
+        async with BatchedRpc(config, "ethereum") as rpc:
+            chain_id = rpc.call("eth_chainId")
+            block = rpc.call("eth_blockNumber")
+        print(chain_id.result(), block.result())
+
+    Results of the read-only methods in ``RPC_CACHE_TTL_NS`` are cached per
+    ``(network, method, params)`` and repeat calls skip the network entirely.
+    """
+
+    __slots__ = ("config", "network", "url", "session", "cache", "_pending", "_next_id")
+
+    def __init__(
+        self,
+        config: Config,
+        network: str,
+        session: aiohttp.ClientSession | None = None,
+        cache: TtlCache | None = None,
+    ):
+        self.config = config
+        self.network = network
+        self.url = config.get_rpc_url(network)
+        self.session = session or config.get_session(network)
+        self.cache = rpc_cache if cache is None else cache
+        self._pending: list[tuple[str, Sequence[Any], asyncio.Future]] = []
+        self._next_id = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            await self.flush()
+        else:
+            for _, _, future in self._pending:
+                future.cancel()
+            self._pending = []
+
+    def call(self, method: str, params: Sequence[Any] = ()) -> asyncio.Future:
+        """Queue a call and return a future for its result"""
+        future = asyncio.get_running_loop().create_future()
+
+        category = _CACHED_METHODS.get(method)
+        if category is not None:
+            key = (self.network, method, json_dumps(list(params)))
+            cached = self.cache.get(key, _MISSING)
+            if cached is not _MISSING:
+                future.set_result(cached)
+                return future
+            ttl_ns = RPC_CACHE_TTL_NS[category]
+
+            def store(done: asyncio.Future) -> None:
+                if not done.cancelled() and done.exception() is None:
+                    self.cache.set(key, done.result(), ttl_ns)
+
+            future.add_done_callback(store)
+
+        self._pending.append((method, params, future))
+        return future
+
+    async def flush(self) -> None:
+        """Send all queued calls, one POST per rpc_batch_size calls"""
+        pending, self._pending = self._pending, []
+        size = max(1, self.config.rpc_batch_size)
+        await asyncio.gather(
+            *(self._send(pending[i : i + size]) for i in range(0, len(pending), size))
+        )
+
+    async def _send(self, calls: list[tuple[str, Sequence[Any], asyncio.Future]]):
+        futures: dict[int, asyncio.Future] = {}
+        payload = []
+        for method, params, future in calls:
+            self._next_id += 1
+            futures[self._next_id] = future
+            payload.append(
+                {
+                    "jsonrpc": "2.0",
+                    "id": self._next_id,
+                    "method": method,
+                    "params": list(params),
+                }
+            )
+
+        try:
+            async with self.session.post(self.url, data=json_dumps(payload)) as resp:
+                body = await resp.read()
+                if resp.status != 200:
+                    raise Exception(
+                        f"RPC request failed: {resp.status} - {body.decode(errors='replace')}"
+                    )
+                responses = json_loads(body)
+            if not isinstance(responses, list):
+                error = responses.get("error") or {}
+                raise RpcError(error.get("code", 0), error.get("message", "bad batch"))
+        except Exception as e:
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        try:
+            # Batch responses may arrive in any order; match them up by id
+            for response in responses:
+                if not isinstance(response, dict):
+                    continue
+                future = futures.pop(response.get("id"), None)
+                if future is None or future.done():
+                    continue
+                if "error" in response:
+                    error = response["error"]
+                    if not isinstance(error, dict):
+                        error = {"message": str(error)}
+                    future.set_exception(
+                        RpcError(error.get("code", 0), error.get("message", ""))
+                    )
+                else:
+                    future.set_result(response.get("result"))
+        finally:
+            # Whatever the endpoint sent, no call is left waiting
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(RpcError(0, "missing response in batch"))
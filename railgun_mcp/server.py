@@ -7,99 +7,345 @@ This server connects to the Railgun network using configuration from environment
 or a config file, allowing users to interact with their actual Railgun wallets and balances.
 """
 
+import asyncio
+import functools
+import json
 import logging
-from typing import Dict, List, Any, Optional
+import re
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from urllib.parse import urlsplit
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    List,
+    Mapping,
+    Any,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from fastmcp import FastMCP
 import aiohttp
+from typing_extensions import NotRequired, TypedDict
+from yarl import URL
 
 # Import from our modules
-from .models import Config
+from .models import (
+    SUPPORTED_NETWORKS,
+    get_config,
+    json_dumps,
+    json_loads_exact,
+    make_connector,
+)
+from .rpc import TtlCache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the pooled API and RPC sessions when the server stops.
+
+    Runs on the serving loop, so sessions are closed on the loop that opened
+    them, however the server exits (including stdio EOF).
+    """
+    try:
+        yield
+    finally:
+        await cleanup_api_client()
+
+
 # Initialize FastMCP server
-mcp = FastMCP("railgun-mcp")
+mcp = FastMCP("railgun-mcp", lifespan=lifespan)
 
 # Initialize configuration
-config = Config()
+config = get_config()
+
+
+# Connection pool for the shared Railgun API session; sized per host by
+# config.api_pool_per_host
+API_POOL_LIMIT = 256
+API_KEEPALIVE_TIMEOUT = 75
+
+# Shared HTTP session; every tool call reuses its pooled, kept-alive connections
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_session() -> aiohttp.ClientSession:
+    """Get or create the shared Railgun API session"""
+    global _session
+    if _session is None or _session.closed:
+        connector = make_connector(
+            limit=API_POOL_LIMIT,
+            limit_per_host=config.api_pool_per_host,
+            keepalive_timeout=API_KEEPALIVE_TIMEOUT,
+        )
+        _session = aiohttp.ClientSession(
+            connector=connector,
+            headers=dict(config.rpc_default_headers),
+            timeout=aiohttp.ClientTimeout(total=config.api_timeout),
+            # Falls back to stdlib json for ints orjson can't encode; responses
+            # are parsed with json_loads_exact for the same reason
+            json_serialize=json_dumps,
+        )
+    return _session
+
+
+# Query string for API GETs, as (name, value) pairs. Values must be
+# str/int/float; booleans are sent as "true"/"false"
+QueryParams = Sequence[Tuple[str, Any]]
+
+
+# Most of an API error body to pass on to the caller
+API_ERROR_LIMIT = 1000
+
+
+async def read_response(response: aiohttp.ClientResponse) -> Dict:
+    """Parse an API response, raising ClientResponseError on HTTP errors.
+
+    The error message is the API's own explanation (its "error", "message" or
+    "detail" field, or the raw body) rather than just the HTTP reason.
+    """
+    if response.status < 400:
+        body = await response.read()
+        return json_loads_exact(body) if body.strip() else None
+
+    body = (await response.text(errors="replace")).strip()
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        payload = None
+    if isinstance(payload, dict):
+        detail = next(
+            (payload[k] for k in ("error", "message", "detail") if payload.get(k)),
+            body,
+        )
+        body = detail if isinstance(detail, str) else json_dumps(detail)
+    raise aiohttp.ClientResponseError(
+        response.request_info,
+        response.history,
+        status=response.status,
+        message=body[:API_ERROR_LIMIT] or response.reason or "",
+        headers=response.headers,
+    )
 
 
 # API Client for Railgun
 class RailgunAPIClient:
-    """Client for interacting with Railgun API"""
+    """Client for interacting with Railgun API over the shared session"""
 
-    def __init__(self, api_key: str, api_url: str):
+    __slots__ = ("api_key", "api_url", "base_url", "session")
+
+    def __init__(self, api_key: str, api_url: str, session: aiohttp.ClientSession):
         self.api_key = api_key
         self.api_url = api_url
-        self.session = None
+        # Parsed once; endpoint URLs are joined onto it per request
+        self.base_url = URL(api_url)
+        self.session = session
+        self.session.headers.update({"Authorization": f"Bearer {api_key}"})
 
-    async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            headers={"Authorization": f"Bearer {self.api_key}"}
-        )
-        return self
-
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
-
-    async def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
-        """Make GET request to Railgun API"""
+    async def get(self, *path: str, params: Optional[QueryParams] = None) -> Dict:
+        """Make GET request to Railgun API, e.g. get("wallets", wallet_id)"""
         async with self.session.get(
-            f"{self.api_url}{endpoint}", params=params
+            self.base_url.joinpath(*path), params=params
         ) as response:
-            if response.status == 200:
-                return await response.json()
-            else:
-                error_data = await response.text()
-                raise Exception(f"API request failed: {response.status} - {error_data}")
+            return await read_response(response)
 
-    async def post(self, endpoint: str, data: Dict) -> Dict:
-        """Make POST request to Railgun API"""
+    async def post(self, *path: str, data: Dict) -> Dict:
+        """Make POST request to Railgun API, e.g. post("wallets", "create", data=...)"""
         async with self.session.post(
-            f"{self.api_url}{endpoint}", json=data
+            self.base_url.joinpath(*path), json=data
         ) as response:
-            if response.status in (200, 201):
-                return await response.json()
-            else:
-                error_data = await response.text()
-                raise Exception(f"API request failed: {response.status} - {error_data}")
+            return await read_response(response)
+
 
+# Global API client, as the task that builds it; concurrent first calls all
+# await the same task instead of each building a client
+_client_task: Optional["asyncio.Task[RailgunAPIClient]"] = None
 
-# Global API client instance
-api_client = None
+
+async def _build_client() -> RailgunAPIClient:
+    # The API is authenticated with its own key; the wallet private key must
+    # never leave the machine, so it is not a fallback
+    if not config.api_key:
+        raise Exception(
+            "⚠️  RAILGUN_API_KEY not configured. Set it, or api_key in ~/.railgun/config.json, to use the Railgun API"
+        )
+    # NOTE: This is still using fake API calls and needs to be replaced with real blockchain interaction
+    return RailgunAPIClient(config.api_key, config.railgun_api_url, get_session())
 
 
 async def get_api_client() -> RailgunAPIClient:
     """Get or create API client instance"""
-    global api_client
-    if not api_client:
-        if not config.private_key:
-            raise Exception(
-                "⚠️  RAILGUN_PRIVATE_KEY not configured. This server needs a complete rewrite - see ARCHITECTURE_UPDATE.md"
-            )
-        # NOTE: This is still using fake API calls and needs to be replaced with real blockchain interaction
-        api_client = await RailgunAPIClient(
-            config.private_key, "fake-api-url"
-        ).__aenter__()
-    return api_client
+    global _client_task
+    # No await between the check and the assignment, so this cannot race
+    task = _client_task
+    if task is None:
+        task = _client_task = asyncio.ensure_future(_build_client())
+    try:
+        return await task
+    except Exception:
+        # Don't cache failures; the next call retries
+        if _client_task is task:
+            _client_task = None
+        raise
+
+
+# Seconds to reuse idempotent API reads for
+GAS_PRICE_TTL = 5
+RELAYERS_TTL = 30
+WALLETS_TTL = 2
+# The supported-token list rarely changes
+TOKENS_TTL = 3600
+
+# Recent API reads, stored as their tasks so concurrent callers asking for the
+# same key share one in-flight request
+_response_cache = TtlCache()
+
+
+async def cached(key: str, ttl: float, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Return fetch()'s result, reusing it for `ttl` seconds per key"""
+    task = _response_cache.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _response_cache.set(key, task, int(ttl * 10**9))
+    try:
+        # Shielded so one cancelled caller doesn't cancel the shared request
+        return await asyncio.shield(task)
+    except Exception:
+        if _response_cache.get(key) is task:
+            _response_cache.pop(key)
+        raise
+
+
+async def fetch_gas_price(client: RailgunAPIClient, network: str) -> Dict:
+    """Get the gas price response for a network, cached for GAS_PRICE_TTL"""
+    return await cached(
+        f"gas:{network}", GAS_PRICE_TTL, lambda: client.get("gas-price", network)
+    )
+
+
+async def fetch_gas_price_wei(client: RailgunAPIClient, network: str) -> int:
+    """Get a network's gas price in wei, from the cached gas price response"""
+    return int((await fetch_gas_price(client, network))["gas_price"])
 
 
 async def cleanup_api_client():
     """Cleanup API client resources"""
-    global api_client
-    if api_client:
-        await api_client.__aexit__(None, None, None)
-        api_client = None
+    global _client_task, _session
+    _client_task = None
+    _response_cache.clear()
+    if _session:
+        await _session.close()
+        # Give SSL transports a moment to finish closing
+        await asyncio.sleep(0.25)
+        _session = None
+    await config.close_sessions()
+
+
+# Maximum concurrent API requests from a single fan-out tool call; lower for
+# batches of write requests (wallet creation, transfers)
+FANOUT_LIMIT = 32
+BATCH_LIMIT = 8
+
+
+async def gather_bounded(
+    aws: Iterable[Awaitable[Any]],
+    limit: int = FANOUT_LIMIT,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """Like asyncio.gather, but with at most `limit` awaitables in flight.
+
+    Batches of writes should pass return_exceptions=True: one failure then
+    doesn't hide the requests that went through (or are still in flight).
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(
+        *(run(aw) for aw in aws), return_exceptions=return_exceptions
+    )
+
+
+def error_result(e: Exception) -> Dict[str, Any]:
+    """Describe an exception as an unsuccessful result"""
+    if isinstance(e, aiohttp.ClientResponseError):
+        return {
+            "success": False,
+            "error": f"API request failed: {e.status} - {e.message}",
+            "status_code": e.status,
+        }
+    return {"success": False, "error": str(e)}
+
+
+def tool_result(
+    fn: Callable[..., Awaitable[Dict[str, Any]]],
+) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """Turn any exception raised by a tool into its error result"""
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs) -> Dict[str, Any]:
+        try:
+            return await fn(*args, **kwargs)
+        except Exception as e:
+            return error_result(e)
+
+    return wrapper
+
+
+# Typed results for the most-called tools. FastMCP serializes these against a
+# known schema instead of inspecting every value, and publishes it to clients
+# as the tool's output schema. Undeclared keys are dropped on serialization, so
+# every key a tool can return must be listed.
+class ToolResult(TypedDict):
+    success: bool
+    error: NotRequired[str]
+    status_code: NotRequired[int]
+
+
+class BalanceResult(ToolResult):
+    wallet_id: NotRequired[str]
+    balances: NotRequired[Dict[str, Any]]
+
+
+class TransactionHistoryResult(ToolResult):
+    transactions: NotRequired[List[Dict[str, Any]]]
+    total: NotRequired[int]
+    limit: NotRequired[int]
+    offset: NotRequired[int]
+    next_cursor: NotRequired[Optional[str]]
+
+
+class AffordabilityDetails(TypedDict):
+    token_balance: str
+    private_balance: str
+    eth_balance: str
+    estimated_gas_cost: str
+    gas_price_gwei: float
+
+
+class AffordabilityResult(ToolResult):
+    can_afford: NotRequired[bool]
+    summary: NotRequired[str]
+    details: NotRequired[AffordabilityDetails]
 
 
 # === WALLET MANAGEMENT TOOLS ===
 
 
 @mcp.tool()
+@tool_result
 async def create_wallet(network: str, password: Optional[str] = None) -> Dict[str, Any]:
     """
     Create a new Railgun wallet with both 0x (public) and 0zk (private) addresses.
@@ -108,34 +354,33 @@ async def create_wallet(network: str, password: Optional[str] = None) -> Dict[st
         network: Network to create wallet on (ethereum, arbitrum, polygon, bsc)
         password: Optional password to encrypt the wallet (uses config password if not provided)
     """
-    try:
-        client = await get_api_client()
-        wallet_password = password or config.wallet_password
-
-        if not wallet_password:
-            return {
-                "success": False,
-                "error": "Wallet password required. Set RAILGUN_WALLET_PASSWORD or provide password parameter",
-            }
-
-        # Call Railgun API to create wallet
-        response = await client.post(
-            "/wallets/create", {"network": network, "password": wallet_password}
-        )
+    client = await get_api_client()
+    wallet_password = password or config.wallet_password
 
+    if not wallet_password:
         return {
-            "success": True,
-            "wallet_id": response["wallet_id"],
-            "address_0x": response["address_0x"],
-            "address_0zk": response["address_0zk"],
-            "network": network,
-            "message": "Wallet created successfully. Your wallet is encrypted with the provided password.",
+            "success": False,
+            "error": "Wallet password required. Set RAILGUN_WALLET_PASSWORD or provide password parameter",
         }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+
+    # Call Railgun API to create wallet
+    response = await client.post(
+        "wallets", "create", data={"network": network, "password": wallet_password}
+    )
+    _response_cache.pop("wallets")
+
+    return {
+        "success": True,
+        "wallet_id": response["wallet_id"],
+        "address_0x": response["address_0x"],
+        "address_0zk": response["address_0zk"],
+        "network": network,
+        "message": "Wallet created successfully. Your wallet is encrypted with the provided password.",
+    }
 
 
 @mcp.tool()
+@tool_result
 async def import_wallet(
     private_key: str, network: str, password: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -147,61 +392,59 @@ async def import_wallet(
         network: Network for the wallet
         password: Optional password to encrypt the imported wallet
     """
-    try:
-        client = await get_api_client()
-        wallet_password = password or config.wallet_password
-
-        if not wallet_password:
-            return {
-                "success": False,
-                "error": "Wallet password required. Set RAILGUN_WALLET_PASSWORD or provide password parameter",
-            }
-
-        response = await client.post(
-            "/wallets/import",
-            {
-                "private_key": private_key,
-                "network": network,
-                "password": wallet_password,
-            },
-        )
+    client = await get_api_client()
+    wallet_password = password or config.wallet_password
 
+    if not wallet_password:
         return {
-            "success": True,
-            "wallet_id": response["wallet_id"],
-            "address_0x": response["address_0x"],
-            "address_0zk": response["address_0zk"],
-            "network": network,
+            "success": False,
+            "error": "Wallet password required. Set RAILGUN_WALLET_PASSWORD or provide password parameter",
         }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+
+    response = await client.post(
+        "wallets",
+        "import",
+        data={
+            "private_key": private_key,
+            "network": network,
+            "password": wallet_password,
+        },
+    )
+    _response_cache.pop("wallets")
+
+    return {
+        "success": True,
+        "wallet_id": response["wallet_id"],
+        "address_0x": response["address_0x"],
+        "address_0zk": response["address_0zk"],
+        "network": network,
+    }
 
 
 @mcp.tool()
+@tool_result
 async def list_wallets() -> Dict[str, Any]:
     """
     List all wallets associated with the configured API key.
     """
-    try:
-        client = await get_api_client()
-        response = await client.get("/wallets")
+    client = await get_api_client()
+    response = await cached("wallets", WALLETS_TTL, lambda: client.get("wallets"))
 
-        return {
-            "success": True,
-            "wallets": response["wallets"],
-            "count": len(response["wallets"]),
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "wallets": response["wallets"],
+        "count": len(response["wallets"]),
+    }
 
 
 # === BALANCE AND FUNDING TOOLS ===
 
 
 @mcp.tool()
+@tool_result
 async def get_balance(
     wallet_id: str, token_address: Optional[str] = None, include_private: bool = True
-) -> Dict[str, Any]:
+) -> BalanceResult:
     """
     Get wallet balances for both public (0x) and private (0zk) addresses.
 
@@ -210,25 +453,26 @@ async def get_balance(
         token_address: Optional token address to filter by
         include_private: Whether to include private balances
     """
-    try:
-        client = await get_api_client()
+    client = await get_api_client()
 
-        params = {"wallet_id": wallet_id, "include_private": include_private}
-        if token_address:
-            params["token_address"] = token_address
+    params = (
+        ("wallet_id", wallet_id),
+        ("include_private", "true" if include_private else "false"),
+    )
+    if token_address:
+        params += (("token_address", token_address),)
 
-        response = await client.get("/balances", params=params)
+    response = await client.get("balances", params=params)
 
-        return {
-            "success": True,
-            "wallet_id": wallet_id,
-            "balances": response["balances"],
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "wallet_id": wallet_id,
+        "balances": response["balances"],
+    }
 
 
 @mcp.tool()
+@tool_result
 async def get_gas_price(network: str) -> Dict[str, Any]:
     """
     Get current gas prices for a network.
@@ -236,25 +480,23 @@ async def get_gas_price(network: str) -> Dict[str, Any]:
     Args:
         network: Network to get gas price for
     """
-    try:
-        client = await get_api_client()
-        response = await client.get(f"/gas-price/{network}")
+    client = await get_api_client()
+    response = await fetch_gas_price(client, network)
 
-        return {
-            "success": True,
-            "network": network,
-            "gas_price": response["gas_price"],
-            "base_fee": response.get("base_fee"),
-            "priority_fee": response.get("priority_fee"),
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "network": network,
+        "gas_price": response["gas_price"],
+        "base_fee": response.get("base_fee"),
+        "priority_fee": response.get("priority_fee"),
+    }
 
 
 # === TRANSACTION TOOLS ===
 
 
 @mcp.tool()
+@tool_result
 async def shield_tokens(
     wallet_id: str,
     token_address: str,
@@ -272,36 +514,34 @@ async def shield_tokens(
         recipient_0zk_address: Optional recipient 0zk address (defaults to sender's 0zk)
         gas_price: Optional gas price in wei
     """
-    try:
-        client = await get_api_client()
+    client = await get_api_client()
 
-        data = {
-            "wallet_id": wallet_id,
-            "token_address": token_address,
-            "amount": amount,
-            "password": config.wallet_password,
-        }
+    data = {
+        "wallet_id": wallet_id,
+        "token_address": token_address,
+        "amount": amount,
+        "password": config.wallet_password,
+    }
 
-        if recipient_0zk_address:
-            data["recipient_0zk_address"] = recipient_0zk_address
-        if gas_price:
-            data["gas_price"] = gas_price
+    if recipient_0zk_address:
+        data["recipient_0zk_address"] = recipient_0zk_address
+    if gas_price:
+        data["gas_price"] = gas_price
 
-        response = await client.post("/transactions/shield", data)
+    response = await client.post("transactions", "shield", data=data)
 
-        return {
-            "success": True,
-            "transaction_id": response["transaction_id"],
-            "tx_hash": response["tx_hash"],
-            "status": response["status"],
-            "gas_used": response.get("gas_used"),
-            "message": "Shield transaction submitted successfully",
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "transaction_id": response["transaction_id"],
+        "tx_hash": response["tx_hash"],
+        "status": response["status"],
+        "gas_used": response.get("gas_used"),
+        "message": "Shield transaction submitted successfully",
+    }
 
 
 @mcp.tool()
+@tool_result
 async def unshield_tokens(
     wallet_id: str,
     token_address: str,
@@ -319,36 +559,34 @@ async def unshield_tokens(
         recipient_0x_address: Optional recipient public address (defaults to sender's 0x)
         gas_price: Optional gas price in wei
     """
-    try:
-        client = await get_api_client()
+    client = await get_api_client()
 
-        data = {
-            "wallet_id": wallet_id,
-            "token_address": token_address,
-            "amount": amount,
-            "password": config.wallet_password,
-        }
+    data = {
+        "wallet_id": wallet_id,
+        "token_address": token_address,
+        "amount": amount,
+        "password": config.wallet_password,
+    }
 
-        if recipient_0x_address:
-            data["recipient_0x_address"] = recipient_0x_address
-        if gas_price:
-            data["gas_price"] = gas_price
+    if recipient_0x_address:
+        data["recipient_0x_address"] = recipient_0x_address
+    if gas_price:
+        data["gas_price"] = gas_price
 
-        response = await client.post("/transactions/unshield", data)
+    response = await client.post("transactions", "unshield", data=data)
 
-        return {
-            "success": True,
-            "transaction_id": response["transaction_id"],
-            "tx_hash": response["tx_hash"],
-            "status": response["status"],
-            "gas_used": response.get("gas_used"),
-            "message": "Unshield transaction submitted successfully",
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "transaction_id": response["transaction_id"],
+        "tx_hash": response["tx_hash"],
+        "status": response["status"],
+        "gas_used": response.get("gas_used"),
+        "message": "Unshield transaction submitted successfully",
+    }
 
 
 @mcp.tool()
+@tool_result
 async def private_transfer(
     wallet_id: str,
     token_address: str,
@@ -368,37 +606,35 @@ async def private_transfer(
         gas_price: Optional gas price in wei
         memo: Optional encrypted memo for the recipient
     """
-    try:
-        client = await get_api_client()
-
-        data = {
-            "wallet_id": wallet_id,
-            "token_address": token_address,
-            "amount": amount,
-            "recipient_0zk_address": recipient_0zk_address,
-            "password": config.wallet_password,
-        }
+    client = await get_api_client()
+
+    data = {
+        "wallet_id": wallet_id,
+        "token_address": token_address,
+        "amount": amount,
+        "recipient_0zk_address": recipient_0zk_address,
+        "password": config.wallet_password,
+    }
 
-        if gas_price:
-            data["gas_price"] = gas_price
-        if memo:
-            data["memo"] = memo
+    if gas_price:
+        data["gas_price"] = gas_price
+    if memo:
+        data["memo"] = memo
 
-        response = await client.post("/transactions/private-transfer", data)
+    response = await client.post("transactions", "private-transfer", data=data)
 
-        return {
-            "success": True,
-            "transaction_id": response["transaction_id"],
-            "tx_hash": response["tx_hash"],
-            "status": response["status"],
-            "gas_used": response.get("gas_used"),
-            "message": "Private transfer submitted successfully",
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "transaction_id": response["transaction_id"],
+        "tx_hash": response["tx_hash"],
+        "status": response["status"],
+        "gas_used": response.get("gas_used"),
+        "message": "Private transfer submitted successfully",
+    }
 
 
 @mcp.tool()
+@tool_result
 async def get_transaction_status(transaction_id: str) -> Dict[str, Any]:
     """
     Get the status of a transaction.
@@ -406,55 +642,61 @@ async def get_transaction_status(transaction_id: str) -> Dict[str, Any]:
     Args:
         transaction_id: ID of the transaction
     """
-    try:
-        client = await get_api_client()
-        response = await client.get(f"/transactions/{transaction_id}")
+    client = await get_api_client()
+    response = await client.get("transactions", transaction_id)
 
-        return {"success": True, "transaction": response["transaction"]}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {"success": True, "transaction": response["transaction"]}
 
 
 @mcp.tool()
+@tool_result
 async def get_transaction_history(
     wallet_id: str,
     limit: int = 50,
     offset: int = 0,
     transaction_type: Optional[str] = None,
-) -> Dict[str, Any]:
+    cursor: Optional[str] = None,
+) -> TransactionHistoryResult:
     """
     Get transaction history for a wallet.
 
     Args:
         wallet_id: ID of the wallet
         limit: Maximum number of transactions to return
-        offset: Number of transactions to skip
+        offset: Number of transactions to skip (ignored when cursor is given)
         transaction_type: Filter by type (shield, unshield, private_transfer)
+        cursor: next_cursor from a previous page, to continue from there
     """
-    try:
-        client = await get_api_client()
+    client = await get_api_client()
 
-        params = {"wallet_id": wallet_id, "limit": limit, "offset": offset}
-        if transaction_type:
-            params["type"] = transaction_type
+    params = (
+        ("wallet_id", wallet_id),
+        ("limit", limit),
+        ("cursor", cursor) if cursor else ("offset", offset),
+    )
+    if transaction_type:
+        params += (("type", transaction_type),)
 
-        response = await client.get("/transactions", params=params)
+    response = await client.get("transactions", params=params)
 
-        return {
-            "success": True,
-            "transactions": response["transactions"],
-            "total": response["total"],
-            "limit": limit,
-            "offset": offset,
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    result: TransactionHistoryResult = {
+        "success": True,
+        "transactions": response["transactions"],
+        "total": response["total"],
+        "limit": limit,
+        "next_cursor": response.get("next_cursor"),
+    }
+    # A cursor replaces the offset, so only report an offset that was applied
+    if not cursor:
+        result["offset"] = offset
+    return result
 
 
 # === RECIPE AND DEFI TOOLS ===
 
 
 @mcp.tool()
+@tool_result
 async def create_recipe(
     name: str, description: str, network: str, steps: List[Dict[str, Any]]
 ) -> Dict[str, Any]:
@@ -467,29 +709,27 @@ async def create_recipe(
         network: Network for the recipe
         steps: List of steps in the recipe
     """
-    try:
-        client = await get_api_client()
+    client = await get_api_client()
 
-        response = await client.post(
-            "/recipes",
-            {
-                "name": name,
-                "description": description,
-                "network": network,
-                "steps": steps,
-            },
-        )
+    response = await client.post(
+        "recipes",
+        data={
+            "name": name,
+            "description": description,
+            "network": network,
+            "steps": steps,
+        },
+    )
 
-        return {
-            "success": True,
-            "recipe_id": response["recipe_id"],
-            "message": "Recipe created successfully",
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "recipe_id": response["recipe_id"],
+        "message": "Recipe created successfully",
+    }
 
 
 @mcp.tool()
+@tool_result
 async def execute_recipe(
     wallet_id: str,
     recipe_id: str,
@@ -507,35 +747,33 @@ async def execute_recipe(
         slippage_percentage: Allowed slippage percentage
         gas_price: Optional gas price in wei
     """
-    try:
-        client = await get_api_client()
-
-        data = {
-            "wallet_id": wallet_id,
-            "recipe_id": recipe_id,
-            "input_amounts": input_amounts,
-            "slippage_percentage": slippage_percentage,
-            "password": config.wallet_password,
-        }
+    client = await get_api_client()
+
+    data = {
+        "wallet_id": wallet_id,
+        "recipe_id": recipe_id,
+        "input_amounts": input_amounts,
+        "slippage_percentage": slippage_percentage,
+        "password": config.wallet_password,
+    }
 
-        if gas_price:
-            data["gas_price"] = gas_price
+    if gas_price:
+        data["gas_price"] = gas_price
 
-        response = await client.post("/recipes/execute", data)
+    response = await client.post("recipes", "execute", data=data)
 
-        return {
-            "success": True,
-            "transaction_id": response["transaction_id"],
-            "tx_hash": response["tx_hash"],
-            "status": response["status"],
-            "outputs": response.get("outputs", []),
-            "message": "Recipe execution submitted successfully",
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "transaction_id": response["transaction_id"],
+        "tx_hash": response["tx_hash"],
+        "status": response["status"],
+        "outputs": response.get("outputs", []),
+        "message": "Recipe execution submitted successfully",
+    }
 
 
 @mcp.tool()
+@tool_result
 async def estimate_recipe_gas(
     recipe_id: str, input_amounts: List[Dict[str, str]]
 ) -> Dict[str, Any]:
@@ -546,25 +784,24 @@ async def estimate_recipe_gas(
         recipe_id: ID of the recipe
         input_amounts: List of token amounts as inputs
     """
-    try:
-        client = await get_api_client()
+    client = await get_api_client()
 
-        response = await client.post(
-            "/recipes/estimate-gas",
-            {"recipe_id": recipe_id, "input_amounts": input_amounts},
-        )
+    response = await client.post(
+        "recipes",
+        "estimate-gas",
+        data={"recipe_id": recipe_id, "input_amounts": input_amounts},
+    )
 
-        return {
-            "success": True,
-            "estimated_gas": response["estimated_gas"],
-            "gas_breakdown": response.get("gas_breakdown", {}),
-            "estimated_cost_wei": response.get("estimated_cost_wei"),
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "estimated_gas": response["estimated_gas"],
+        "gas_breakdown": response.get("gas_breakdown", {}),
+        "estimated_cost_wei": response.get("estimated_cost_wei"),
+    }
 
 
 @mcp.tool()
+@tool_result
 async def create_swap_recipe(
     network: str, sell_token: str, buy_token: str, dex: str = "0x"
 ) -> Dict[str, Any]:
@@ -577,34 +814,34 @@ async def create_swap_recipe(
         buy_token: Address of token to buy
         dex: DEX to use (0x, uniswap, sushiswap)
     """
-    try:
-        client = await get_api_client()
+    client = await get_api_client()
 
-        response = await client.post(
-            "/recipes/templates/swap",
-            {
-                "network": network,
-                "sell_token": sell_token,
-                "buy_token": buy_token,
-                "dex": dex,
-            },
-        )
+    response = await client.post(
+        "recipes",
+        "templates",
+        "swap",
+        data={
+            "network": network,
+            "sell_token": sell_token,
+            "buy_token": buy_token,
+            "dex": dex,
+        },
+    )
 
-        return {
-            "success": True,
-            "recipe_id": response["recipe_id"],
-            "recipe_name": response["recipe_name"],
-            "steps": response["steps"],
-            "message": "Swap recipe created successfully",
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "recipe_id": response["recipe_id"],
+        "recipe_name": response["recipe_name"],
+        "steps": response["steps"],
+        "message": "Swap recipe created successfully",
+    }
 
 
 # === RELAYER TOOLS ===
 
 
 @mcp.tool()
+@tool_result
 async def get_relayers(network: str) -> Dict[str, Any]:
     """
     Get list of available relayers for a network.
@@ -612,21 +849,23 @@ async def get_relayers(network: str) -> Dict[str, Any]:
     Args:
         network: Network to get relayers for
     """
-    try:
-        client = await get_api_client()
-        response = await client.get(f"/relayers/{network}")
+    client = await get_api_client()
+    response = await cached(
+        f"relayers:{network}",
+        RELAYERS_TTL,
+        lambda: client.get("relayers", network),
+    )
 
-        return {
-            "success": True,
-            "network": network,
-            "relayers": response["relayers"],
-            "count": len(response["relayers"]),
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "network": network,
+        "relayers": response["relayers"],
+        "count": len(response["relayers"]),
+    }
 
 
 @mcp.tool()
+@tool_result
 async def submit_to_relayer(
     transaction_data: str, relayer_id: str, priority: str = "standard"
 ) -> Dict[str, Any]:
@@ -638,33 +877,32 @@ async def submit_to_relayer(
         relayer_id: ID of the relayer to use
         priority: Transaction priority (low, standard, high)
     """
-    try:
-        client = await get_api_client()
-
-        response = await client.post(
-            "/relayers/submit",
-            {
-                "transaction_data": transaction_data,
-                "relayer_id": relayer_id,
-                "priority": priority,
-            },
-        )
+    client = await get_api_client()
+
+    response = await client.post(
+        "relayers",
+        "submit",
+        data={
+            "transaction_data": transaction_data,
+            "relayer_id": relayer_id,
+            "priority": priority,
+        },
+    )
 
-        return {
-            "success": True,
-            "relayer_transaction_id": response["relayer_transaction_id"],
-            "estimated_time": response.get("estimated_time"),
-            "fee": response.get("fee"),
-            "message": "Transaction submitted to relayer successfully",
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "relayer_transaction_id": response["relayer_transaction_id"],
+        "estimated_time": response.get("estimated_time"),
+        "fee": response.get("fee"),
+        "message": "Transaction submitted to relayer successfully",
+    }
 
 
 # === MULTI-WALLET TOOLS ===
 
 
 @mcp.tool()
+@tool_result
 async def create_wallet_batch(
     count: int, network: str, password_prefix: str, use_unique_passwords: bool = True
 ) -> Dict[str, Any]:
@@ -677,22 +915,35 @@ async def create_wallet_batch(
         password_prefix: Base password or prefix for unique passwords
         use_unique_passwords: Whether to use unique passwords for each wallet
     """
-    try:
-        if count > 10:
-            return {"success": False, "error": "Maximum 10 wallets per batch"}
+    if count > 10:
+        return {"success": False, "error": "Maximum 10 wallets per batch"}
 
-        client = await get_api_client()
-        wallets_created = []
+    client = await get_api_client()
 
-        for i in range(count):
-            password = (
-                f"{password_prefix}_{i}" if use_unique_passwords else password_prefix
-            )
+    def wallet_password(i: int) -> str:
+        return f"{password_prefix}_{i}" if use_unique_passwords else password_prefix
 
-            response = await client.post(
-                "/wallets/create", {"network": network, "password": password}
+    responses = await gather_bounded(
+        (
+            client.post(
+                "wallets",
+                "create",
+                data={"network": network, "password": wallet_password(i)},
             )
-
+            for i in range(count)
+        ),
+        limit=BATCH_LIMIT,
+        return_exceptions=True,
+    )
+    _response_cache.pop("wallets")
+
+    # Report every wallet that was created, even if others failed
+    wallets_created = []
+    failures = []
+    for i, response in enumerate(responses):
+        if isinstance(response, Exception):
+            failures.append({"index": i, **error_result(response)})
+        else:
             wallets_created.append(
                 {
                     "wallet_id": response["wallet_id"],
@@ -702,18 +953,21 @@ async def create_wallet_batch(
                 }
             )
 
-        return {
-            "success": True,
-            "wallets_created": wallets_created,
-            "count": len(wallets_created),
-            "network": network,
-            "message": f"Created {count} wallets successfully",
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    result = {
+        "success": not failures,
+        "wallets_created": wallets_created,
+        "count": len(wallets_created),
+        "network": network,
+        "message": f"Created {len(wallets_created)} of {count} wallets",
+    }
+    if failures:
+        result["failures"] = failures
+        result["error"] = f"{len(failures)} of {count} wallets could not be created"
+    return result
 
 
 @mcp.tool()
+@tool_result
 async def distribute_tokens(
     source_wallet_id: str,
     token_address: str,
@@ -733,32 +987,33 @@ async def distribute_tokens(
         distribution_type: "equal" or "custom"
         amounts: Custom amounts for each wallet (required if distribution_type is "custom")
     """
-    try:
-        client = await get_api_client()
-        transfers = []
-
-        if distribution_type == "equal":
-            amount_per_wallet = str(int(total_amount) // len(destination_wallet_ids))
-            amounts = [amount_per_wallet] * len(destination_wallet_ids)
-        elif distribution_type == "custom" and not amounts:
-            return {
-                "success": False,
-                "error": "Custom amounts required for custom distribution",
-            }
+    client = await get_api_client()
 
-        # Get destination addresses
-        destinations = []
-        for wallet_id in destination_wallet_ids:
-            wallet_info = await client.get(f"/wallets/{wallet_id}")
-            destinations.append(
-                {"wallet_id": wallet_id, "address_0zk": wallet_info["address_0zk"]}
-            )
+    if distribution_type == "equal":
+        amount_per_wallet = str(int(total_amount) // len(destination_wallet_ids))
+        amounts = [amount_per_wallet] * len(destination_wallet_ids)
+    elif distribution_type == "custom" and not amounts:
+        return {
+            "success": False,
+            "error": "Custom amounts required for custom distribution",
+        }
 
-        # Execute transfers
-        for i, dest in enumerate(destinations):
-            response = await client.post(
-                "/transactions/private-transfer",
-                {
+    # Get destination addresses
+    wallet_infos = await gather_bounded(
+        client.get("wallets", wallet_id) for wallet_id in destination_wallet_ids
+    )
+    destinations = [
+        {"wallet_id": wallet_id, "address_0zk": wallet_info["address_0zk"]}
+        for wallet_id, wallet_info in zip(destination_wallet_ids, wallet_infos)
+    ]
+
+    # Execute transfers
+    responses = await gather_bounded(
+        (
+            client.post(
+                "transactions",
+                "private-transfer",
+                data={
                     "wallet_id": source_wallet_id,
                     "token_address": token_address,
                     "amount": amounts[i],
@@ -766,28 +1021,45 @@ async def distribute_tokens(
                     "password": config.wallet_password,
                 },
             )
-
-            transfers.append(
-                {
-                    "to_wallet": dest["wallet_id"],
-                    "amount": amounts[i],
-                    "tx_hash": response["tx_hash"],
-                    "status": response["status"],
-                }
+            for i, dest in enumerate(destinations)
+        ),
+        limit=BATCH_LIMIT,
+        return_exceptions=True,
+    )
+
+    # Report each transfer's outcome; a failed one must not hide the ones that
+    # were sent, or a retry would send them twice
+    transfers = []
+    distributed = 0
+    for i, (dest, response) in enumerate(zip(destinations, responses)):
+        transfer = {"to_wallet": dest["wallet_id"], "amount": amounts[i]}
+        if isinstance(response, Exception):
+            transfer.update(error_result(response))
+        else:
+            transfer.update(
+                success=True, tx_hash=response["tx_hash"], status=response["status"]
             )
-
-        return {
-            "success": True,
-            "source_wallet": source_wallet_id,
-            "transfers": transfers,
-            "total_distributed": total_amount,
-            "message": f"Distributed tokens to {len(transfers)} wallets",
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+            distributed += int(amounts[i])
+        transfers.append(transfer)
+    sent = sum(transfer["success"] for transfer in transfers)
+
+    result = {
+        "success": sent == len(transfers),
+        "source_wallet": source_wallet_id,
+        "transfers": transfers,
+        "total_distributed": str(distributed),
+        "message": f"Distributed tokens to {sent} of {len(transfers)} wallets",
+    }
+    if sent < len(transfers):
+        result["error"] = (
+            f"{len(transfers) - sent} of {len(transfers)} transfers failed; "
+            "only retry those"
+        )
+    return result
 
 
 @mcp.tool()
+@tool_result
 async def mix_tokens(
     wallet_ids: List[str],
     token_address: str,
@@ -803,24 +1075,22 @@ async def mix_tokens(
         mixing_rounds: Number of mixing rounds
         delay_seconds: Delay between transactions
     """
-    try:
-        client = await get_api_client()
+    client = await get_api_client()
 
-        # This would implement a mixing strategy
-        # In production, this would use more sophisticated mixing algorithms
+    # This would implement a mixing strategy
+    # In production, this would use more sophisticated mixing algorithms
 
-        return {
-            "success": True,
-            "message": "Token mixing initiated",
-            "wallets": len(wallet_ids),
-            "rounds": mixing_rounds,
-            "estimated_time": mixing_rounds * delay_seconds * len(wallet_ids),
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "message": "Token mixing initiated",
+        "wallets": len(wallet_ids),
+        "rounds": mixing_rounds,
+        "estimated_time": mixing_rounds * delay_seconds * len(wallet_ids),
+    }
 
 
 @mcp.tool()
+@tool_result
 async def get_wallet_analytics(
     wallet_ids: List[str], include_transactions: bool = True
 ) -> Dict[str, Any]:
@@ -831,48 +1101,133 @@ async def get_wallet_analytics(
         wallet_ids: List of wallet IDs to analyze
         include_transactions: Whether to include transaction summaries
     """
-    try:
-        client = await get_api_client()
-        analytics = {
-            "total_wallets": len(wallet_ids),
-            "wallets": [],
-            "aggregate": {"total_value_usd": 0, "tokens": {}},
-        }
+    client = await get_api_client()
+    analytics = {
+        "total_wallets": len(wallet_ids),
+        "wallets": [],
+        "aggregate": {"total_value_usd": 0, "tokens": {}},
+    }
 
-        for wallet_id in wallet_ids:
-            # Get balance for each wallet
-            balance_response = await client.get(
-                "/balances", {"wallet_id": wallet_id, "include_private": True}
+    async def analyze_wallet(wallet_id: str) -> Dict[str, Any]:
+        # Balance and recent transactions are independent; fetch together
+        requests = [
+            client.get(
+                "balances",
+                params=(("wallet_id", wallet_id), ("include_private", "true")),
+            )
+        ]
+        if include_transactions:
+            requests.append(
+                client.get(
+                    "transactions", params=(("wallet_id", wallet_id), ("limit", 10))
+                )
             )
+        balance_response, *tx_responses = await asyncio.gather(*requests)
 
-            wallet_data = {
-                "wallet_id": wallet_id,
-                "balances": balance_response["balances"],
-                "total_value_usd": balance_response.get("total_value_usd", 0),
-            }
+        wallet_data = {
+            "wallet_id": wallet_id,
+            "balances": balance_response["balances"],
+            "total_value_usd": balance_response.get("total_value_usd", 0),
+        }
 
-            if include_transactions:
-                tx_response = await client.get(
-                    "/transactions", {"wallet_id": wallet_id, "limit": 10}
-                )
-                wallet_data["recent_transactions"] = tx_response["transactions"]
-                wallet_data["total_transactions"] = tx_response["total"]
+        if tx_responses:
+            tx_response = tx_responses[0]
+            wallet_data["recent_transactions"] = tx_response["transactions"]
+            wallet_data["total_transactions"] = tx_response["total"]
 
-            analytics["wallets"].append(wallet_data)
-            analytics["aggregate"]["total_value_usd"] += wallet_data["total_value_usd"]
+        return wallet_data
 
-        return {"success": True, "analytics": analytics}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    # Each wallet issues up to two requests, so bound wallets rather than
+    # requests to keep at most FANOUT_LIMIT requests in flight
+    wallets = analytics["wallets"]
+    aggregate = analytics["aggregate"]
+    for wallet_data in await gather_bounded(
+        (analyze_wallet(wallet_id) for wallet_id in wallet_ids),
+        limit=FANOUT_LIMIT // 2,
+    ):
+        wallets.append(wallet_data)
+        aggregate["total_value_usd"] += wallet_data["total_value_usd"]
+
+    return {"success": True, "analytics": analytics}
 
 
 # === PLAIN ENGLISH PROBLEM SOLVERS ===
 
+WEI: Final = 10**18
+GWEI: Final = 10**9
+
+# Decimals of the well-known tokens, and the matching unit size; balances of
+# anything else are displayed as if it used 18 decimals like ETH
+DECIMALS: Final[Mapping[str, int]] = MappingProxyType(
+    {"USDC": 6, "USDT": 6, "DAI": 18, "ETH": 18}
+)
+_POW10: Final[Mapping[str, int]] = MappingProxyType(
+    {token: 10**decimals for token, decimals in DECIMALS.items()}
+)
+
+
+def format_units(amount: int, token: str) -> str:
+    """Format a base-unit amount of a known token in whole tokens, exactly"""
+    whole, fraction = divmod(amount, _POW10[token])
+    digits = str(fraction).rjust(DECIMALS[token], "0").rstrip("0")
+    return f"{whole}.{digits}" if digits else str(whole)
+
+
+# A human-readable amount with an optional token symbol, e.g. "10.5 USDC"
+_AMOUNT_RE: Final = re.compile(r"\s*(\d+(?:\.\d+)?)\s*([A-Za-z]+)?\s*$")
+
+# Rough gas usage per action, used when estimating what a transaction costs
+DEFAULT_ACTION_GAS: Final = 200000
+ERC20_TRANSFER_GAS: Final = 65000
+_ACTION_GAS_COSTS: Final[Mapping[str, int]] = MappingProxyType(
+    {
+        "shield": 200000,
+        "unshield": 180000,
+        "swap": 300000,
+        "send": 150000,
+        "private_send": 180000,
+    }
+)
+
+_COST_EXPLANATIONS: Final[Mapping[str, Mapping[str, Any]]] = MappingProxyType(
+    {
+        "shield": MappingProxyType(
+            {
+                "base_gas": _ACTION_GAS_COSTS["shield"],
+                "reason": "Shielding creates a zero-knowledge proof and adds your tokens to the private pool. It's like putting money in a magical safe that proves you own it without showing what's inside.",
+                "tip": "Shield larger amounts less frequently to save on gas",
+            }
+        ),
+        "unshield": MappingProxyType(
+            {
+                "base_gas": _ACTION_GAS_COSTS["unshield"],
+                "reason": "Unshielding removes tokens from the private pool while maintaining privacy. It's like taking money out of the magical safe without revealing your identity.",
+                "tip": "Batch your unshields if possible",
+            }
+        ),
+        "swap": MappingProxyType(
+            {
+                "base_gas": _ACTION_GAS_COSTS["swap"],
+                "reason": "Private swaps do 3 things: unshield tokens, swap them, and re-shield the result. It's like secretly trading at a market while wearing an invisibility cloak.",
+                "tip": "Swap larger amounts to make the gas worthwhile",
+            }
+        ),
+    }
+)
+_DEFAULT_EXPLANATION: Final[Mapping[str, Any]] = MappingProxyType(
+    {
+        "base_gas": DEFAULT_ACTION_GAS,
+        "reason": "Railgun uses advanced cryptography to keep your transactions private.",
+        "tip": "Private transactions cost more but protect your financial privacy",
+    }
+)
+
 
 @mcp.tool()
+@tool_result
 async def can_i_afford_this(
     wallet_id: str, action: str, amount: Optional[str] = None, token: str = "USDC"
-) -> Dict[str, Any]:
+) -> AffordabilityResult:
     """
     Check if you have enough tokens AND gas to do what you want.
 
@@ -884,64 +1239,56 @@ async def can_i_afford_this(
 
     Example: "Can I afford to swap 1000 USDC?"
     """
-    try:
-        client = await get_api_client()
-
-        # Get balances
-        balances = await client.get("/balances", {"wallet_id": wallet_id})
-        gas_price = await client.get("/gas-price/ethereum")
-
-        # Estimate costs
-        action_gas_costs = {
-            "shield": 200000,
-            "unshield": 180000,
-            "swap": 300000,
-            "send": 150000,
-            "private_send": 180000,
-        }
-
-        gas_needed = action_gas_costs.get(action.lower(), 200000)
-        gas_cost_eth = (gas_needed * int(gas_price["gas_price"])) / 10**18
-
-        # Check token balance
-        token_balance = balances["balances"]["public"].get(token, "0")
-        private_balance = balances["balances"]["private"].get(token, "0")
-
-        can_afford = True
-        issues = []
-
-        if amount and int(amount) > int(token_balance) + int(private_balance):
-            can_afford = False
-            issues.append(
-                f"Not enough {token}. You have {token_balance} public + {private_balance} private"
-            )
+    client = await get_api_client()
+
+    # Get balances and gas price together; they don't depend on each other
+    balances, gas_price_wei = await asyncio.gather(
+        client.get("balances", params=(("wallet_id", wallet_id),)),
+        fetch_gas_price_wei(client, "ethereum"),
+    )
+
+    # Estimate costs
+    gas_needed = _ACTION_GAS_COSTS.get(action.lower(), DEFAULT_ACTION_GAS)
+    gas_cost_wei = gas_needed * gas_price_wei
+
+    # Check token balance
+    token_balance = balances["balances"]["public"].get(token, "0")
+    private_balance = balances["balances"]["private"].get(token, "0")
+    eth_balance_wei = int(balances["balances"]["public"].get("ETH", "0"))
+
+    can_afford = True
+    issues = []
+
+    if amount and int(amount) > int(token_balance) + int(private_balance):
+        can_afford = False
+        issues.append(
+            f"Not enough {token}. You have {token_balance} public + {private_balance} private"
+        )
 
-        eth_balance = float(balances["balances"]["public"].get("ETH", "0")) / 10**18
-        if eth_balance < gas_cost_eth:
-            can_afford = False
-            issues.append(
-                f"Not enough ETH for gas. Need {gas_cost_eth:.4f} ETH, have {eth_balance:.4f} ETH"
-            )
+    if eth_balance_wei < gas_cost_wei:
+        can_afford = False
+        issues.append(
+            f"Not enough ETH for gas. Need {gas_cost_wei / WEI:.4f} ETH, have {eth_balance_wei / WEI:.4f} ETH"
+        )
 
-        return {
-            "success": True,
-            "can_afford": can_afford,
-            "summary": (
-                "✅ You're good to go!" if can_afford else "❌ " + " AND ".join(issues)
-            ),
-            "details": {
-                "token_balance": token_balance,
-                "private_balance": private_balance,
-                "eth_balance": str(int(eth_balance * 10**18)),
-                "estimated_gas_cost": str(int(gas_cost_eth * 10**18)),
-                "gas_price_gwei": int(gas_price["gas_price"]) / 10**9,
-            },
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "can_afford": can_afford,
+        "summary": (
+            "✅ You're good to go!" if can_afford else "❌ " + " AND ".join(issues)
+        ),
+        "details": {
+            "token_balance": token_balance,
+            "private_balance": private_balance,
+            "eth_balance": str(eth_balance_wei),
+            "estimated_gas_cost": str(gas_cost_wei),
+            "gas_price_gwei": gas_price_wei / GWEI,
+        },
+    }
 
 
 @mcp.tool()
+@tool_result
 async def why_is_this_so_expensive(
     action: str, network: str = "ethereum"
 ) -> Dict[str, Any]:
@@ -954,55 +1301,26 @@ async def why_is_this_so_expensive(
 
     Example: "Why is shielding so expensive?"
     """
-    try:
-        client = await get_api_client()
-        gas_price = await client.get(f"/gas-price/{network}")
-
-        explanations = {
-            "shield": {
-                "base_gas": 200000,
-                "reason": "Shielding creates a zero-knowledge proof and adds your tokens to the private pool. It's like putting money in a magical safe that proves you own it without showing what's inside.",
-                "tip": "Shield larger amounts less frequently to save on gas",
-            },
-            "unshield": {
-                "base_gas": 180000,
-                "reason": "Unshielding removes tokens from the private pool while maintaining privacy. It's like taking money out of the magical safe without revealing your identity.",
-                "tip": "Batch your unshields if possible",
-            },
-            "swap": {
-                "base_gas": 300000,
-                "reason": "Private swaps do 3 things: unshield tokens, swap them, and re-shield the result. It's like secretly trading at a market while wearing an invisibility cloak.",
-                "tip": "Swap larger amounts to make the gas worthwhile",
-            },
-        }
+    client = await get_api_client()
+    gas_price_wei = await fetch_gas_price_wei(client, network)
 
-        info = explanations.get(
-            action.lower(),
-            {
-                "base_gas": 200000,
-                "reason": "Railgun uses advanced cryptography to keep your transactions private.",
-                "tip": "Private transactions cost more but protect your financial privacy",
-            },
-        )
+    info = _COST_EXPLANATIONS.get(action.lower(), _DEFAULT_EXPLANATION)
 
-        gas_cost_usd = (
-            info["base_gas"] * int(gas_price["gas_price"]) / 10**18
-        ) * 2000  # Assume $2000 ETH
+    gas_cost_usd = (info["base_gas"] * gas_price_wei / WEI) * 2000  # Assume $2000 ETH
 
-        return {
-            "success": True,
-            "explanation": info["reason"],
-            "estimated_cost_usd": f"${gas_cost_usd:.2f}",
-            "gas_needed": info["base_gas"],
-            "current_gas_price": f"{int(gas_price['gas_price']) / 10**9:.1f} gwei",
-            "money_saving_tip": info["tip"],
-            "cheaper_times": "Usually late night US time or weekends",
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "explanation": info["reason"],
+        "estimated_cost_usd": f"${gas_cost_usd:.2f}",
+        "gas_needed": info["base_gas"],
+        "current_gas_price": f"{gas_price_wei / GWEI:.1f} gwei",
+        "money_saving_tip": info["tip"],
+        "cheaper_times": "Usually late night US time or weekends",
+    }
 
 
 @mcp.tool()
+@tool_result
 async def just_send_money(
     wallet_id: str, to: str, amount: str, token: str = "USDC", keep_private: bool = True
 ) -> Dict[str, Any]:
@@ -1018,70 +1336,81 @@ async def just_send_money(
 
     Example: "Just send 100 USDC to alice.eth privately"
     """
-    try:
-        client = await get_api_client()
-
-        # Parse amount if needed
-        if " " in amount:
-            amount, token = amount.split(" ")
-
-        # Convert human-readable amount to wei/smallest unit
-        decimals = {"USDC": 6, "USDT": 6, "DAI": 18, "ETH": 18}
-        amount_wei = str(int(float(amount) * 10 ** decimals.get(token, 18)))
-
-        steps_taken = []
-
-        if keep_private:
-            # Check if we need to shield first
-            balances = await client.get("/balances", {"wallet_id": wallet_id})
-            private_balance = balances["balances"]["private"].get(token, "0")
-
-            if int(private_balance) < int(amount_wei):
-                # Need to shield more
-                shield_amount = str(int(amount_wei) - int(private_balance))
-                shield_response = await client.post(
-                    "/transactions/shield",
-                    {
-                        "wallet_id": wallet_id,
-                        "token_address": "0x...",  # Would be resolved
-                        "amount": shield_amount,
-                        "password": config.wallet_password,
-                    },
-                )
-                steps_taken.append(
-                    f"Shielded {float(shield_amount) / 10**decimals[token]} {token}"
-                )
+    client = await get_api_client()
+
+    # Parse amount, which may name its token ("10 USDC")
+    match = _AMOUNT_RE.match(amount)
+    if match is None:
+        raise Exception(f"Can't read amount {amount!r}; use e.g. '10' or '10 USDC'")
+    amount, token = match.group(1), (match.group(2) or token).upper()
+
+    # Never guess the decimals of a token we're sending: a wrong guess sends
+    # the wrong amount by orders of magnitude
+    decimals = DECIMALS.get(token)
+    if decimals is None:
+        raise Exception(f"Unknown token {token!r}; use one of {', '.join(DECIMALS)}")
+    whole, _, fraction = amount.partition(".")
+    if len(fraction) > decimals:
+        raise Exception(f"{token} amounts have at most {decimals} decimal places")
+
+    # Convert human-readable amount to wei/smallest unit by shifting the digits,
+    # which is exact however many there are
+    amount_wei = str(int(whole + fraction.ljust(decimals, "0")))
+
+    steps_taken = []
+
+    if keep_private:
+        # Check if we need to shield first
+        balances = await client.get("balances", params=(("wallet_id", wallet_id),))
+        private_balance = balances["balances"]["private"].get(token, "0")
 
-            # Send privately
-            transfer_response = await client.post(
-                "/transactions/private-transfer",
-                {
+        if int(private_balance) < int(amount_wei):
+            # Need to shield more
+            shield_amount = str(int(amount_wei) - int(private_balance))
+            shield_response = await client.post(
+                "transactions",
+                "shield",
+                data={
                     "wallet_id": wallet_id,
-                    "token_address": "0x...",
-                    "amount": amount_wei,
-                    "recipient_0zk_address": to,
+                    "token_address": "0x...",  # Would be resolved
+                    "amount": shield_amount,
                     "password": config.wallet_password,
                 },
             )
-            steps_taken.append(f"Sent {amount} {token} privately")
-        else:
-            # Just send publicly
-            # Would implement public send
-            steps_taken.append(f"Sent {amount} {token} publicly")
+            steps_taken.append(
+                f"Shielded {format_units(int(shield_amount), token)} {token}"
+            )
 
-        return {
-            "success": True,
-            "message": f"✅ Sent {amount} {token} to {to[:8]}...!",
-            "steps_taken": steps_taken,
-            "tx_hash": transfer_response.get("tx_hash"),
-            "privacy_level": "🔒 Fully Private" if keep_private else "👁️ Public",
-            "estimated_time": "2-5 minutes",
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+        # Send privately
+        transfer_response = await client.post(
+            "transactions",
+            "private-transfer",
+            data={
+                "wallet_id": wallet_id,
+                "token_address": "0x...",
+                "amount": amount_wei,
+                "recipient_0zk_address": to,
+                "password": config.wallet_password,
+            },
+        )
+        steps_taken.append(f"Sent {amount} {token} privately")
+    else:
+        # Just send publicly
+        # Would implement public send
+        steps_taken.append(f"Sent {amount} {token} publicly")
+
+    return {
+        "success": True,
+        "message": f"✅ Sent {amount} {token} to {to[:8]}...!",
+        "steps_taken": steps_taken,
+        "tx_hash": transfer_response.get("tx_hash"),
+        "privacy_level": "🔒 Fully Private" if keep_private else "👁️ Public",
+        "estimated_time": "2-5 minutes",
+    }
 
 
 @mcp.tool()
+@tool_result
 async def where_are_my_tokens(
     wallet_id: str, show_details: bool = False
 ) -> Dict[str, Any]:
@@ -1094,61 +1423,53 @@ async def where_are_my_tokens(
 
     Example: "Where are my tokens?"
     """
-    try:
-        client = await get_api_client()
-        balances = await client.get(
-            "/balances", {"wallet_id": wallet_id, "include_private": True}
-        )
-
-        summary = []
-        total_usd = 0
-
-        # Combine public and private balances
-        all_tokens = {}
-
-        for token, amount in balances["balances"]["public"].items():
-            if token not in all_tokens:
-                all_tokens[token] = {"public": 0, "private": 0, "total": 0}
-            all_tokens[token]["public"] = amount
-
-        for token, amount in balances["balances"]["private"].items():
-            if token not in all_tokens:
-                all_tokens[token] = {"public": 0, "private": 0, "total": 0}
-            all_tokens[token]["private"] = amount
-
-        # Format nicely
-        for token, amounts in all_tokens.items():
-            decimals = {"USDC": 6, "USDT": 6, "DAI": 18, "ETH": 18}.get(token, 18)
-
-            public_amount = float(amounts["public"]) / 10**decimals
-            private_amount = float(amounts["private"]) / 10**decimals
-            total = public_amount + private_amount
-
-            if total > 0.01:  # Only show tokens with meaningful amounts
-                if private_amount > 0 and public_amount > 0:
-                    status = f"{total:.2f} {token} (🔓 {public_amount:.2f} public + 🔒 {private_amount:.2f} private)"
-                elif private_amount > 0:
-                    status = f"🔒 {private_amount:.2f} {token} (all private)"
-                else:
-                    status = f"🔓 {public_amount:.2f} {token} (all public)"
+    client = await get_api_client()
+    balances = await client.get(
+        "balances", params=(("wallet_id", wallet_id), ("include_private", "true"))
+    )
+
+    summary = []
+    total_usd = 0
+
+    # Combine public and private balances (public tokens first); the advice is
+    # worked out in the same pass that formats them
+    public_balances = balances["balances"]["public"]
+    private_balances = balances["balances"]["private"]
+    all_tokens = {**public_balances, **private_balances}
+    has_public = False
+
+    # Format nicely
+    for token in all_tokens:
+        unit = _POW10.get(token, WEI)
+        public_amount = float(public_balances.get(token, 0)) / unit
+        private_amount = float(private_balances.get(token, 0)) / unit
+        total = public_amount + private_amount
+        has_public = has_public or public_amount > 0
+
+        if total > 0.01:  # Only show tokens with meaningful amounts
+            if private_amount > 0 and public_amount > 0:
+                status = f"{total:.2f} {token} (🔓 {public_amount:.2f} public + 🔒 {private_amount:.2f} private)"
+            elif private_amount > 0:
+                status = f"🔒 {private_amount:.2f} {token} (all private)"
+            else:
+                status = f"🔓 {public_amount:.2f} {token} (all public)"
 
-                summary.append(status)
+            summary.append(status)
 
-        return {
-            "success": True,
-            "summary": summary if summary else ["No tokens found"],
-            "total_tokens": len(all_tokens),
-            "advice": (
-                "Shield tokens to make them private"
-                if any(float(t["public"]) > 0 for t in all_tokens.values())
-                else "Your tokens are private! 🎉"
-            ),
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "summary": summary if summary else ["No tokens found"],
+        "total_tokens": len(all_tokens),
+        "advice": (
+            "Shield tokens to make them private"
+            if has_public
+            else "Your tokens are private! 🎉"
+        ),
+    }
 
 
 @mcp.tool()
+@tool_result
 async def fix_stuck_transaction(
     wallet_id: str, transaction_id: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -1161,48 +1482,55 @@ async def fix_stuck_transaction(
 
     Example: "Fix my stuck transaction"
     """
-    try:
-        client = await get_api_client()
+    client = await get_api_client()
 
-        # Get recent transactions
-        txs = await client.get(
-            "/transactions", {"wallet_id": wallet_id, "limit": 10, "status": "pending"}
-        )
+    # Only the first pending transaction is diagnosed, so fetch just that one
+    txs = await client.get(
+        "transactions",
+        params=(("wallet_id", wallet_id), ("limit", 1), ("status", "pending")),
+    )
 
-        if not txs["transactions"]:
-            return {
-                "success": True,
-                "message": "No stuck transactions found! You're all good 👍",
-            }
+    if not txs["transactions"]:
+        return {
+            "success": True,
+            "message": "No stuck transactions found! You're all good 👍",
+        }
 
-        stuck_tx = txs["transactions"][0]
-        solutions = []
+    stuck_tx = txs["transactions"][0]
+    solutions = []
 
-        # Diagnose the issue
-        if stuck_tx.get("gas_price", 0) < 20 * 10**9:  # Less than 20 gwei
-            solutions.append("Gas price too low. Need to speed up with higher gas.")
+    # Diagnose the issue
+    if stuck_tx.get("gas_price", 0) < 20 * GWEI:  # Less than 20 gwei
+        solutions.append("Gas price too low. Need to speed up with higher gas.")
 
-        if stuck_tx.get("age_minutes", 0) > 30:
-            solutions.append("Transaction is old. May need to cancel and retry.")
+    if stuck_tx.get("age_minutes", 0) > 30:
+        solutions.append("Transaction is old. May need to cancel and retry.")
 
-        # Offer solutions
-        return {
-            "success": True,
-            "stuck_transaction": {
-                "id": stuck_tx["id"],
-                "type": stuck_tx["type"],
-                "age": f"{stuck_tx.get('age_minutes', 0)} minutes",
-                "gas_price": f"{stuck_tx.get('gas_price', 0) / 10**9} gwei",
-            },
-            "solutions": solutions,
-            "quick_fix": "Try cancelling and resending with 50% higher gas price",
-            "prevent_future": "Always check gas prices before sending",
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    # Offer solutions
+    return {
+        "success": True,
+        "stuck_transaction": {
+            "id": stuck_tx["id"],
+            "type": stuck_tx["type"],
+            "age": f"{stuck_tx.get('age_minutes', 0)} minutes",
+            "gas_price": f"{stuck_tx.get('gas_price', 0) / GWEI} gwei",
+        },
+        "solutions": solutions,
+        "quick_fix": "Try cancelling and resending with 50% higher gas price",
+        "prevent_future": "Always check gas prices before sending",
+    }
+
+
+_PRIVACY_NEXT_STEPS: Final = (
+    "Shield remaining public tokens",
+    "Use multiple wallets for different purposes",
+    "Add delays between related transactions",
+    "Use relayers for maximum privacy",
+)
 
 
 @mcp.tool()
+@tool_result
 async def optimize_my_privacy(wallet_id: str) -> Dict[str, Any]:
     """
     Give personalized tips to improve your privacy based on your usage.
@@ -1212,57 +1540,64 @@ async def optimize_my_privacy(wallet_id: str) -> Dict[str, Any]:
 
     Example: "How can I be more private?"
     """
-    try:
-        client = await get_api_client()
+    client = await get_api_client()
 
-        # Analyze wallet
-        balances = await client.get("/balances", {"wallet_id": wallet_id})
-        txs = await client.get("/transactions", {"wallet_id": wallet_id, "limit": 50})
+    # Analyze wallet
+    balances = await client.get("balances", params=(("wallet_id", wallet_id),))
 
-        tips = []
-        score = 100
+    # Balances are integer base units; sum them exactly rather than as floats
+    public_balance = sum(map(int, balances["balances"]["public"].values()))
+    private_balance = sum(map(int, balances["balances"]["private"].values()))
 
-        # Check for privacy issues
-        public_balance = sum(float(v) for v in balances["balances"]["public"].values())
-        private_balance = sum(
-            float(v) for v in balances["balances"]["private"].values()
-        )
+    # An empty wallet has nothing to expose; skip the history request entirely
+    if not public_balance and not private_balance:
+        return {
+            "success": True,
+            "privacy_score": "100/100",
+            "tips": ["👛 This wallet is empty, so there's nothing to expose yet."],
+            "next_steps": list(_PRIVACY_NEXT_STEPS),
+        }
 
-        if public_balance > private_balance:
-            tips.append("🔓 Most of your funds are public! Shield them for privacy.")
-            score -= 30
+    txs = await client.get(
+        "transactions", params=(("wallet_id", wallet_id), ("limit", 50))
+    )
+    tips = []
+    score = 100
 
-        if len(set(tx["to_address"] for tx in txs["transactions"])) < 3:
-            tips.append(
-                "🔄 You're sending to the same addresses repeatedly. Mix it up!"
-            )
-            score -= 20
+    # Collect recipients and transaction hours in one pass over the history
+    recipients = set()
+    hours = set()
+    for tx in txs["transactions"]:
+        recipients.add(tx["to_address"])
+        hours.add(tx.get("hour", 0))
 
-        # Check for timing patterns
-        hours = [tx.get("hour", 0) for tx in txs["transactions"]]
-        if len(set(hours)) < 5:
-            tips.append("⏰ You transact at similar times. Vary your schedule.")
-            score -= 10
+    # Check for privacy issues
+    if public_balance > private_balance:
+        tips.append("🔓 Most of your funds are public! Shield them for privacy.")
+        score -= 30
 
-        if not tips:
-            tips.append("🎉 Great job! Your privacy practices are solid!")
+    if len(recipients) < 3:
+        tips.append("🔄 You're sending to the same addresses repeatedly. Mix it up!")
+        score -= 20
 
-        return {
-            "success": True,
-            "privacy_score": f"{score}/100",
-            "tips": tips,
-            "next_steps": [
-                "Shield remaining public tokens",
-                "Use multiple wallets for different purposes",
-                "Add delays between related transactions",
-                "Use relayers for maximum privacy",
-            ],
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    # Check for timing patterns
+    if len(hours) < 5:
+        tips.append("⏰ You transact at similar times. Vary your schedule.")
+        score -= 10
+
+    if not tips:
+        tips.append("🎉 Great job! Your privacy practices are solid!")
+
+    return {
+        "success": True,
+        "privacy_score": f"{score}/100",
+        "tips": tips,
+        "next_steps": list(_PRIVACY_NEXT_STEPS),
+    }
 
 
 @mcp.tool()
+@tool_result
 async def emergency_exit(
     wallet_id: str, destination: str, reason: str = "general"
 ) -> Dict[str, Any]:
@@ -1276,65 +1611,65 @@ async def emergency_exit(
 
     Example: "Emergency exit all my funds to my hardware wallet"
     """
-    try:
-        client = await get_api_client()
-
-        # Get all balances
-        balances = await client.get(
-            "/balances", {"wallet_id": wallet_id, "include_private": True}
-        )
-
-        exits = []
-        total_gas_needed = 0
-
-        # Plan the exit strategy
-        for token, amount in balances["balances"]["private"].items():
-            if float(amount) > 0:
-                exits.append(
-                    {
-                        "token": token,
-                        "amount": amount,
-                        "type": "unshield",
-                        "gas_estimate": 180000,
-                    }
-                )
-                total_gas_needed += 180000
-
-        for token, amount in balances["balances"]["public"].items():
-            if float(amount) > 0 and token != "ETH":
-                exits.append(
-                    {
-                        "token": token,
-                        "amount": amount,
-                        "type": "transfer",
-                        "gas_estimate": 65000,
-                    }
-                )
-                total_gas_needed += 65000
+    client = await get_api_client()
+
+    # Get all balances, and the gas price for the cost estimate alongside them
+    balances, gas_price_wei = await asyncio.gather(
+        client.get(
+            "balances", params=(("wallet_id", wallet_id), ("include_private", "true"))
+        ),
+        fetch_gas_price_wei(client, "ethereum"),
+    )
+
+    # Plan the exit strategy: unshield every private token, then move every
+    # public token except the ETH paying for gas
+    unshield_gas = _ACTION_GAS_COSTS["unshield"]
+    exits = [
+        {
+            "token": token,
+            "amount": amount,
+            "type": "unshield",
+            "gas_estimate": unshield_gas,
+        }
+        for token, amount in balances["balances"]["private"].items()
+        if int(amount) > 0
+    ]
+    unshields = len(exits)
+    exits += [
+        {
+            "token": token,
+            "amount": amount,
+            "type": "transfer",
+            "gas_estimate": ERC20_TRANSFER_GAS,
+        }
+        for token, amount in balances["balances"]["public"].items()
+        if token != "ETH" and int(amount) > 0
+    ]
+    total_gas_needed = (
+        unshields * unshield_gas + (len(exits) - unshields) * ERC20_TRANSFER_GAS
+    )
 
-        gas_price = await client.get("/gas-price/ethereum")
-        total_cost_eth = (total_gas_needed * int(gas_price["gas_price"])) / 10**18
+    total_cost_eth = (total_gas_needed * gas_price_wei) / WEI
 
-        return {
-            "success": True,
-            "exit_plan": {
-                "steps": len(exits),
-                "tokens_to_move": [e["token"] for e in exits],
-                "estimated_time": f"{len(exits) * 2} minutes",
-                "estimated_cost": f"{total_cost_eth:.4f} ETH",
-                "destination": destination,
-            },
-            "warning": "This will move ALL funds and reduce privacy!",
-            "execute_command": "Use execute_emergency_exit to proceed",
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "exit_plan": {
+            "steps": len(exits),
+            "tokens_to_move": [e["token"] for e in exits],
+            "estimated_time": f"{len(exits) * 2} minutes",
+            "estimated_cost": f"{total_cost_eth:.4f} ETH",
+            "destination": destination,
+        },
+        "warning": "This will move ALL funds and reduce privacy!",
+        "execute_command": "Use execute_emergency_exit to proceed",
+    }
 
 
 # === UTILITY TOOLS ===
 
 
 @mcp.tool()
+@tool_result
 async def verify_proof(proof_data: str) -> Dict[str, Any]:
     """
     Verify a zero-knowledge proof.
@@ -1342,22 +1677,20 @@ async def verify_proof(proof_data: str) -> Dict[str, Any]:
     Args:
         proof_data: The proof data to verify
     """
-    try:
-        client = await get_api_client()
+    client = await get_api_client()
 
-        response = await client.post("/proofs/verify", {"proof_data": proof_data})
+    response = await client.post("proofs", "verify", data={"proof_data": proof_data})
 
-        return {
-            "success": True,
-            "valid": response["valid"],
-            "proof_type": response.get("proof_type"),
-            "verified_at": response.get("verified_at"),
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "valid": response["valid"],
+        "proof_type": response.get("proof_type"),
+        "verified_at": response.get("verified_at"),
+    }
 
 
 @mcp.tool()
+@tool_result
 async def get_supported_tokens(network: str) -> Dict[str, Any]:
     """
     Get list of tokens supported by Railgun on a network.
@@ -1365,18 +1698,17 @@ async def get_supported_tokens(network: str) -> Dict[str, Any]:
     Args:
         network: Network to get supported tokens for
     """
-    try:
-        client = await get_api_client()
-        response = await client.get(f"/tokens/{network}")
+    client = await get_api_client()
+    response = await cached(
+        f"tokens:{network}", TOKENS_TTL, lambda: client.get("tokens", network)
+    )
 
-        return {
-            "success": True,
-            "network": network,
-            "tokens": response["tokens"],
-            "count": len(response["tokens"]),
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "network": network,
+        "tokens": response["tokens"],
+        "count": len(response["tokens"]),
+    }
 
 
 @mcp.tool()
@@ -1388,36 +1720,55 @@ async def check_config() -> Dict[str, Any]:
         "success": True,
         "config": {
             "private_key_set": bool(config.private_key),
+            "api_key_set": bool(config.api_key),
             "wallet_password_set": bool(config.wallet_password),
-            "railgun_contracts": config.railgun_contracts,
+            "supported_networks": sorted(SUPPORTED_NETWORKS),
+            "railgun_contracts": {
+                k: dict(v) for k, v in config.railgun_contracts.items()
+            },
+            # Host (and port) only; paths and userinfo often carry API keys.
+            # Values without a scheme are parsed as network-path references
             "rpc_endpoints": {
-                k: v.split("/")[2] if "/" in v else v
+                k: urlsplit(v if "//" in v else "//" + v).netloc.rpartition("@")[2]
                 for k, v in config.rpc_endpoints.items()
             },
         },
         "warning": "⚠️  This MCP server currently has fake API calls and needs a complete rewrite to work with the real RAILGUN protocol.",
         "required_fix": "See ARCHITECTURE_UPDATE.md for implementation details",
-        "message": "Use RAILGUN_PRIVATE_KEY environment variable or ~/.railgun/config.json to configure",
+        "message": "Use RAILGUN_API_KEY and RAILGUN_PRIVATE_KEY environment variables or ~/.railgun/config.json to configure",
     }
 
 
 # === MAIN ENTRY POINT ===
 
 
+def install_uvloop() -> bool:
+    """Run the server on uvloop when it is installed (not available on Windows)"""
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    # uvloop is the pragmatic fast loop today; an io_uring-backed loop could
+    # replace it on Linux 5.1+ once asyncio grows that backend
+    uvloop.install()
+    return True
+
+
 def main():
     """Main entry point for the Railgun MCP server."""
     import sys
-    import asyncio
 
+    if sys.platform != "win32" and install_uvloop():
+        logger.info("Using uvloop event loop")
+
+    # Sessions are closed by the server's lifespan, on the serving loop
     try:
         mcp.run()
     except KeyboardInterrupt:
         logger.info("Shutting down Railgun MCP server...")
-        asyncio.run(cleanup_api_client())
         sys.exit(0)
     except Exception as e:
         logger.error(f"Server error: {e}")
-        asyncio.run(cleanup_api_client())
         sys.exit(1)
 
 
@@ -10,7 +10,7 @@ import json
 from pathlib import Path
 from unittest.mock import patch
 
-from railgun_mcp.models import Config
+from railgun_mcp.models import Config, _load_config_file, get_config
 
 
 def test_config_defaults():
@@ -25,6 +25,10 @@ def test_config_defaults():
         assert "arbitrum" in config.rpc_endpoints
         assert "polygon" in config.rpc_endpoints
         assert "bsc" in config.rpc_endpoints
+        assert not hasattr(config, "__dict__")
+        assert config.get_railgun_proxy("ethereum") == (
+            "0xfa7093cdd9ee6932b4eb2c9e1cde7ce00b1fa4b9"
+        )
 
 
 def test_config_from_env():
@@ -34,6 +38,8 @@ def test_config_from_env():
         "RAILGUN_WALLET_PASSWORD": "test-password",
         "RAILGUN_API_URL": "https://test-api.railgun.org/v1",
         "ETHEREUM_RPC_URL": "https://test-eth-rpc.com",
+        "RAILGUN_API_POOL_PER_HOST": "8",
+        "RAILGUN_API_TIMEOUT": "5",
     }
 
     with patch.dict(os.environ, env_vars, clear=True):
@@ -43,6 +49,9 @@ def test_config_from_env():
         assert config.wallet_password == "test-password"
         assert config.railgun_api_url == "https://test-api.railgun.org/v1"
         assert config.rpc_endpoints["ethereum"] == "https://test-eth-rpc.com"
+        assert config.get_rpc_url("ethereum") == "https://test-eth-rpc.com"
+        assert config.api_pool_per_host == 8
+        assert config.api_timeout == 5.0
 
 
 def test_config_from_file():
@@ -101,5 +110,73 @@ def test_env_overrides_file():
                 assert config.wallet_password == "file-password"
 
 
+def test_contract_overrides_do_not_touch_defaults():
+    """Test that config file contract overrides copy the shared defaults."""
+    config_data = {
+        "railgun_contracts": {
+            "ethereum": {"proxy": "0x0000000000000000000000000000000000000001"},
+            "arbitrum": {"proxy": "0x0000000000000000000000000000000000000002"},
+        },
+    }
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / ".railgun"
+        config_dir.mkdir()
+        with open(config_dir / "config.json", "w") as f:
+            json.dump(config_data, f)
+
+        with patch("pathlib.Path.home", return_value=Path(temp_dir)):
+            with patch.dict(os.environ, {}, clear=True):
+                overridden = Config()
+
+    with patch.dict(os.environ, {}, clear=True):
+        default = Config()
+
+    assert overridden.railgun_contracts["ethereum"]["proxy"].endswith("0001")
+    assert "poseidon" in overridden.railgun_contracts["ethereum"]
+    assert overridden.railgun_contracts["arbitrum"]["proxy"].endswith("0002")
+    assert "arbitrum" not in default.railgun_contracts
+    assert overridden.get_railgun_proxy("arbitrum").endswith("0002")
+    assert default.get_railgun_proxy("arbitrum") is None
+    assert not default.railgun_contracts["ethereum"]["proxy"].endswith("0001")
+
+
+def test_config_file_parsed_once_until_changed():
+    """Test that the config file is re-parsed only when it changes."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / ".railgun"
+        config_dir.mkdir()
+        config_file = config_dir / "config.json"
+        with open(config_file, "w") as f:
+            json.dump({"wallet_password": "first"}, f)
+
+        _load_config_file.cache_clear()
+        with patch("pathlib.Path.home", return_value=Path(temp_dir)):
+            with patch.dict(os.environ, {}, clear=True):
+                Config()
+                assert Config().wallet_password == "first"
+                assert _load_config_file.cache_info().misses == 1
+
+                with open(config_file, "w") as f:
+                    json.dump({"wallet_password": "second-value"}, f)
+
+                assert Config().wallet_password == "second-value"
+                assert _load_config_file.cache_info().misses == 2
+
+
+def test_get_config_is_cached():
+    """Test that get_config returns a single shared instance."""
+    get_config.cache_clear()
+    try:
+        with patch.dict(os.environ, {}, clear=True):
+            first = get_config()
+            assert get_config() is first
+
+            get_config.cache_clear()
+            assert get_config() is not first
+    finally:
+        get_config.cache_clear()
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for Railgun MCP data models.
+"""
+
+import dataclasses
+import json
+
+import pytest
+
+from railgun_mcp.models import (
+    _TRANSACTIONSTATUS_BY_VALUE,
+    Token,
+    TokenAmount,
+    TokenType,
+    TransactionStatus,
+    json_dumps,
+    json_loads,
+    json_loads_exact,
+)
+
+
+def make_token(**overrides):
+    fields = {
+        "address": "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+        "symbol": "USDC",
+        "decimals": 6,
+        "type": TokenType.ERC20,
+        "chain_id": 1,
+    }
+    fields.update(overrides)
+    return Token(**fields)
+
+
+def test_token_is_frozen_and_hashable():
+    """Test that tokens are immutable and usable as cache keys."""
+    token = make_token()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        token.symbol = "DAI"
+
+    assert {token: "usdc"}[make_token()] == "usdc"
+    assert not hasattr(token, "__dict__")
+
+
+def test_token_address_is_normalized():
+    """Test that token addresses are lowercased at construction."""
+    token = make_token()
+
+    assert token.address == "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"
+    assert token == make_token(address=token.address.upper().replace("0X", "0x"))
+
+
+def test_token_amount_has_no_instance_dict():
+    """Test that token amounts use slots instead of a per-instance dict."""
+    amount = TokenAmount(token=make_token(), amount="1000000")
+
+    assert not hasattr(amount, "__dict__")
+    assert amount.amount_wei == 1_000_000
+
+
+def test_json_dumps_serializes_models():
+    """Test that models serialize directly, with enums as their values."""
+    amount = TokenAmount(token=make_token(), amount="1000000")
+
+    data = json_loads(json_dumps(amount))
+
+    assert data["amount"] == "1000000"
+    assert data["token"]["symbol"] == "USDC"
+    assert data["token"]["type"] == "ERC20"
+    assert "_amount_wei" not in data
+
+
+def test_json_dumps_keeps_integers_beyond_64_bits():
+    """Test that wei-sized integers serialize exactly."""
+    data = json.loads(json_dumps({"amount": 10**21, "token": make_token()}))
+
+    assert data["amount"] == 10**21
+    assert data["token"]["type"] == "ERC20"
+
+
+def test_json_loads_exact_keeps_integers_beyond_64_bits():
+    """Test that decoding keeps wei-sized integers exact."""
+    data = json_loads_exact(b'{"wei": 123456789012345678901, "gas": 21000}')
+
+    assert data == {"wei": 123456789012345678901, "gas": 21000}
+    assert json_loads_exact(b'{"max": 18446744073709551615}')["max"] == 2**64 - 1
+    assert json_loads_exact(b'{"id": "12345678901234567890123"}')["id"].isdigit()
+
+
+def test_transaction_status_labels_round_trip():
+    """Test that integer statuses map to and from their API labels."""
+    for status in TransactionStatus:
+        assert _TRANSACTIONSTATUS_BY_VALUE[status.label] is status
+
+    assert TransactionStatus.PENDING.label == "pending"
+    assert TransactionStatus.CANCELLED == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Tests for the Railgun MCP JSON-RPC helpers.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from railgun_mcp.models import Config, make_connector
+from railgun_mcp.rpc import BatchedRpc, RpcError, TtlCache
+
+
+@pytest_asyncio.fixture
+async def rpc_server():
+    """Serve a fake JSON-RPC endpoint that records each batch it receives."""
+    batches = []
+
+    async def handle(request):
+        batch = json.loads(await request.read())
+        batches.append(batch)
+        responses = []
+        for call in reversed(batch):
+            if call["method"] == "eth_junk":
+                responses.append("junk")
+            elif call["method"] == "eth_bare_error":
+                responses.append({"jsonrpc": "2.0", "id": call["id"], "error": {}})
+            elif call["method"] == "eth_fail":
+                responses.append(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": call["id"],
+                        "error": {"code": -32000, "message": "boom"},
+                    }
+                )
+            else:
+                responses.append(
+                    {"jsonrpc": "2.0", "id": call["id"], "result": call["method"]}
+                )
+        return web.json_response(responses)
+
+    app = web.Application()
+    app.router.add_post("/", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}/", batches
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_batched_rpc_splits_and_matches_by_id(rpc_server):
+    """Test that calls are chunked by rpc_batch_size and matched by id."""
+    url, batches = rpc_server
+    env = {"ETHEREUM_RPC_URL": url, "RAILGUN_RPC_BATCH": "2"}
+
+    with patch.dict(os.environ, env, clear=True):
+        config = Config()
+
+    try:
+        async with BatchedRpc(config, "ethereum") as rpc:
+            futures = [rpc.call(f"eth_method{i}", [i]) for i in range(5)]
+            failing = rpc.call("eth_fail")
+    finally:
+        await config.close_sessions()
+
+    assert [f.result() for f in futures] == [f"eth_method{i}" for i in range(5)]
+    with pytest.raises(RpcError):
+        failing.result()
+    assert sorted(len(b) for b in batches) == [2, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_batched_rpc_serves_read_only_calls_from_cache(rpc_server):
+    """Test that cacheable reads only hit the endpoint once within their TTL."""
+    url, batches = rpc_server
+    with patch.dict(os.environ, {"ETHEREUM_RPC_URL": url}, clear=True):
+        config = Config()
+    cache = TtlCache()
+
+    try:
+        for _ in range(2):
+            async with BatchedRpc(config, "ethereum", cache=cache) as rpc:
+                chain_id = rpc.call("eth_chainId")
+                rpc.call("eth_gasPrice")
+            assert chain_id.result() == "eth_chainId"
+    finally:
+        await config.close_sessions()
+
+    assert [[c["method"] for c in b] for b in batches] == [
+        ["eth_chainId", "eth_gasPrice"],
+        ["eth_gasPrice"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batched_rpc_resolves_every_call_despite_malformed_responses(
+    rpc_server,
+):
+    """Test that bare errors and junk entries don't leave calls unresolved."""
+    url, batches = rpc_server
+    with patch.dict(os.environ, {"ETHEREUM_RPC_URL": url}, clear=True):
+        config = Config()
+
+    try:
+        async with BatchedRpc(config, "ethereum", cache=TtlCache()) as rpc:
+            bare = rpc.call("eth_bare_error")
+            junk = rpc.call("eth_junk")
+            ok = rpc.call("eth_ok")
+    finally:
+        await config.close_sessions()
+
+    with pytest.raises(RpcError):
+        bare.result()
+    with pytest.raises(RpcError, match="missing response"):
+        junk.result()
+    assert ok.result() == "eth_ok"
+
+
+def test_ttl_cache_expires_entries():
+    """Test that TtlCache drops entries once their TTL has passed."""
+    cache = TtlCache()
+    cache.set("live", 1, ttl_ns=10**12)
+    cache.set("dead", 2, ttl_ns=-1)
+
+    assert cache.get("live") == 1
+    assert cache.get("dead", "missing") == "missing"
+    assert not hasattr(cache, "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_get_session_is_pooled_per_network():
+    """Test that each network reuses one session until closed."""
+    with patch.dict(os.environ, {}, clear=True):
+        config = Config()
+
+    session = config.get_session("ethereum")
+    assert config.get_session("ethereum") is session
+    assert config.get_session("polygon") is not session
+
+    with pytest.raises(ValueError):
+        config.get_session("solana")
+
+    await config.close_sessions()
+    assert session.closed
+    assert config.get_session("ethereum") is not session
+    await config.close_sessions()
+
+
+@pytest.mark.asyncio
+async def test_connector_resolves_through_aiodns():
+    """Test that connectors use aiodns whenever it is installed."""
+    pytest.importorskip("aiodns")
+    import aiohttp
+
+    connector = make_connector()
+    try:
+        assert isinstance(connector._resolver, aiohttp.AsyncResolver)
+    finally:
+        await connector.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])